@@ -1,6 +1,7 @@
 """Notion API adapter - Page creation and block management"""
 
 import os
+import threading
 import requests
 from dotenv import load_dotenv
 
@@ -8,6 +9,18 @@ from src.adapters.markdown_to_notion import create_notion_blocks
 
 load_dotenv(override=True)
 
+# One session per thread (requests.Session is not thread-safe) so consecutive page/block
+# requests from the same worker reuse its keep-alive connection
+_thread_local = threading.local()
+
+
+def _get_session() -> requests.Session:
+    """Get the calling thread's Notion session"""
+    session = getattr(_thread_local, 'session', None)
+    if session is None:
+        session = _thread_local.session = requests.Session()
+    return session
+
 
 def _get_api_headers() -> dict[str, str]:
     """Get Notion API headers"""
@@ -28,7 +41,7 @@ def _create_page(title: str, blocks: list, database_id: str, headers: dict[str,
         'children': blocks[:100]
     }
     
-    response = requests.post('https://api.notion.com/v1/pages', headers=headers, json=data)
+    response = _get_session().post('https://api.notion.com/v1/pages', headers=headers, json=data)
     
     if response.status_code != 200:
         error_data = response.json()
@@ -43,7 +56,7 @@ def _create_page(title: str, blocks: list, database_id: str, headers: dict[str,
         batch_size = 100
         for i in range(100, len(blocks), batch_size):
             batch = blocks[i:i + batch_size]
-            batch_response = requests.patch(
+            batch_response = _get_session().patch(
                 f'https://api.notion.com/v1/blocks/{page_id}/children',
                 headers=headers,
                 json={'children': batch}
@@ -69,7 +82,7 @@ def create_child_page(parent_page_id: str, title: str, content: str, uploaded_ma
             'children': blocks[:100]
         }
         
-        response = requests.post('https://api.notion.com/v1/pages', headers=headers, json=data)
+        response = _get_session().post('https://api.notion.com/v1/pages', headers=headers, json=data)
         
         if response.status_code != 200:
             error_data = response.json()
@@ -84,7 +97,7 @@ def create_child_page(parent_page_id: str, title: str, content: str, uploaded_ma
             batch_size = 100
             for i in range(100, len(blocks), batch_size):
                 batch = blocks[i:i + batch_size]
-                batch_response = requests.patch(
+                batch_response = _get_session().patch(
                     f'https://api.notion.com/v1/blocks/{page_id}/children',
                     headers=headers,
                     json={'children': batch}
@@ -109,7 +122,7 @@ def add_link_to_page(parent_page_id: str, child_page_id: str, headers: dict[str,
         'link_to_page': {'type': 'page_id', 'page_id': child_page_id}
     }
     
-    response = requests.patch(
+    response = _get_session().patch(
         f'https://api.notion.com/v1/blocks/{parent_page_id}/children',
         headers=headers,
         json={'children': [link_block]}
@@ -117,8 +117,8 @@ def hello():
             self.assertTrue(table['has_column_header'])
         print("✅ Table parsing test passed")
     
-    @patch('src.adapters.notion_api.requests.post')
-    @patch('src.adapters.notion_api.requests.patch')
+    @patch('src.adapters.notion_api.requests.Session.post')
+    @patch('src.adapters.notion_api.requests.Session.patch')
     def test_upload_to_notion_new_page(self, mock_patch, mock_post):
         """Test Notion new page creation"""
         # Mock patch response (for adding blocks)
@@ -142,8 +142,8 @@ def hello():
         self.assertIn('url', result)
         print("✅ upload_to_notion (new page) test passed")
     
-    @patch('src.adapters.notion_api.requests.post')
-    @patch('src.adapters.notion_api.requests.patch')
+    @patch('src.adapters.notion_api.requests.Session.post')
+    @patch('src.adapters.notion_api.requests.Session.patch')
     def test_upload_to_notion_existing_page(self, mock_patch, mock_post):
         """Test Notion page creation when existing page found (existing page search disabled)"""
         # Mock patch response (for adding blocks)
@@ -1,7 +1,9 @@
 """Notion report builder with hierarchical structure support"""
 
+from concurrent.futures import ThreadPoolExecutor
+
 from src.adapters.notion_api import upload_to_notion, create_child_page
-from src.services.image_service import find_local_images, upload_images_to_cloudflare
+from src.services.image_service import find_local_images_multi, upload_images_to_cloudflare
 from src.types.analysis_report import AnalysisReport
 
 
@@ -19,6 +21,7 @@ class NotionReportBuilder:
     def __init__(self):
         self._pages = []
         self._last_add_successful = False
+        self._processed_contents = {}  # {id(report): content with image placeholders}
     
     def add_page(self, report: AnalysisReport | None):
         """
@@ -90,16 +93,15 @@ class NotionReportBuilder:
             return {"status": "error", "message": str(e)}
     
     def _process_all_images(self, summary: str) -> dict:
-        """Collect all content and process images."""
-        all_contents = [summary]
+        """Scan every page once, keep processed content per report, and upload all images."""
+        reports = []
         for page_item in self._pages:
             if page_item['report'] is not None:
-                all_contents.append(page_item['report'].content)
-            for child_report in page_item['children']:
-                if child_report is not None:
-                    all_contents.append(child_report.content)
+                reports.append(page_item['report'])
+            reports.extend(child for child in page_item['children'] if child is not None)
         
-        _, image_files, _ = find_local_images(" ".join(all_contents))
+        processed_contents, image_files, _ = find_local_images_multi([summary] + [r.content for r in reports])
+        self._processed_contents = {id(r): processed for r, processed in zip(reports, processed_contents[1:])}
         return upload_images_to_cloudflare(image_files) if image_files else {}
     
     def _create_parent_page(self, title: str, date: str, summary: str, uploaded_map: dict) -> dict:
@@ -120,24 +122,37 @@ class NotionReportBuilder:
         return parent_result
     
     def _create_child_pages(self, parent_page_id: str, uploaded_map: dict) -> dict:
-        """Create 1st and 2nd level child pages."""
+        """
+        Create 1st and 2nd level child pages.
+        
+        Notion lists child pages in creation order, so pages under the same parent are created
+        one after another. Each 2nd level group only depends on its own parent page, so it is
+        created in a worker thread while the remaining 1st level pages continue.
+        """
         child_page_ids = {}
         
-        for page_item in self._pages:
-            report = page_item['report']
-            if report is None:
-                continue
-            
-            # Create 1st level page
-            processed, _, _ = find_local_images(report.content)
-            child_result = create_child_page(parent_page_id, report.title, processed, uploaded_map)
-            
-            if child_result['status'] == 'success':
-                child_page_ids[report.title] = child_result['page_id']
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            sub_page_futures = []
+            for page_item in self._pages:
+                report = page_item['report']
+                if report is None:
+                    continue
                 
-                # Create 2nd level pages if children exist
-                if page_item['children']:
-                    self._create_sub_pages(child_result['page_id'], page_item['children'], uploaded_map, report.title)
+                # Create 1st level page
+                processed = self._processed_contents[id(report)]
+                child_result = create_child_page(parent_page_id, report.title, processed, uploaded_map)
+                
+                if child_result['status'] == 'success':
+                    child_page_ids[report.title] = child_result['page_id']
+                    
+                    # Create 2nd level pages if children exist
+                    if page_item['children']:
+                        sub_page_futures.append(executor.submit(
+                            self._create_sub_pages, child_result['page_id'], page_item['children'], uploaded_map, report.title
+                        ))
+            
+            for future in sub_page_futures:
+                future.result()
         
         return child_page_ids
     
@@ -147,6 +162,6 @@ class NotionReportBuilder:
         print(f"📂 Creating {len(valid_children)} sub-pages under '{parent_title}'...")
         
         for sub_report in valid_children:
-            sub_processed, _, _ = find_local_images(sub_report.content)
+            sub_processed = self._processed_contents[id(sub_report)]
             create_child_page(parent_page_id, sub_report.title, sub_processed, uploaded_map)
 
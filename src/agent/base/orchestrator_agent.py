@@ -20,6 +20,9 @@ class OrchestratorAgent(AsyncAgent):
     - Synthesizing results
     """
     
+    # Max sub-agents of one orchestrator running at once (keeps nested fan-out within OpenAI rate limits)
+    MAX_CONCURRENT_SUB_AGENTS = 8
+    
     def __init__(self, agent_name: str, hooks: dict = None):
         """
         Initialize orchestrator agent.
@@ -83,9 +86,15 @@ class OrchestratorAgent(AsyncAgent):
         if not self.sub_agents or self.synthesis_agent is None:
             self._setup()
         
-        # Run all sub-agents in parallel
+        # Run all sub-agents in parallel (bounded; gather keeps results in sub_agents order)
         task_prompt = prompt if prompt is not None else ""
-        self.sub_agent_results = await asyncio.gather(*[agent.run(task_prompt) for agent in self.sub_agents])
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SUB_AGENTS)
+        
+        async def _run_bounded(agent: AsyncAgent) -> AnalysisReport:
+            async with semaphore:
+                return await agent.run(task_prompt)
+        
+        self.sub_agent_results = await asyncio.gather(*[_run_bounded(agent) for agent in self.sub_agents])
         
         # Execute hooks after results are collected
         self._execute_hooks('on_results_collected', self.sub_agent_results)
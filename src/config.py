@@ -1,12 +1,22 @@
 """Global configuration settings for the market analysis agent"""
 
 import os
+from functools import lru_cache
+
+from dotenv import load_dotenv
 
 # Language settings for report generation
 # Options: "English" or "Korean"
 REPORT_LANGUAGE = "Korean"
 
 # Directory paths
-CHART_OUTPUT_DIR = os.path.join(os.getcwd(), "charts")
+# Set CHART_OUTPUT_DIR to an in-memory filesystem (e.g. /dev/shm/charts on Linux) to keep chart writes off disk.
+# It is read at import, before .env is loaded (load_env), so it must be set in the real process environment.
+CHART_OUTPUT_DIR = os.getenv("CHART_OUTPUT_DIR") or os.path.join(os.getcwd(), "charts")
 os.makedirs(CHART_OUTPUT_DIR, exist_ok=True)
 
+
+@lru_cache(maxsize=1)
+def load_env() -> None:
+    """Load .env into os.environ once per process, the first time credentials are needed."""
+    load_dotenv()
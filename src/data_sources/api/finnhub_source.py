@@ -4,12 +4,10 @@ import os
 import finnhub
 from datetime import datetime, timedelta
 from typing import Any
-from dotenv import load_dotenv
 
+from src.config import load_env
 from src.data_sources.base import APIDataSource
 
-load_dotenv()
-
 
 class FinnhubSource(APIDataSource):
     """Data source for company fundamentals via Finnhub API."""
@@ -24,6 +22,7 @@ class FinnhubSource(APIDataSource):
     def client(self):
         """Lazy initialization of Finnhub client."""
         if self._client is None:
+            load_env()
             api_key = os.getenv('FINNHUB_API_KEY')
             if not api_key:
                 raise ValueError("FINNHUB_API_KEY not found in environment variables")
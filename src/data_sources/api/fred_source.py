@@ -1,22 +1,32 @@
 """FRED data source for economic indicators."""
 
+import json
 import os
+import tempfile
+import threading
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Any
+import numpy as np
+import pandas as pd
 from fredapi import Fred
-from dotenv import load_dotenv
 
+from src.config import load_env
 from src.data_sources.base import APIDataSource
 from src.utils.charts import create_fred_chart
 
-load_dotenv()
-
 
 class FREDSource(APIDataSource):
     """Data source for economic indicators via FRED API."""
     
     _cache: dict[str, Any] = {}
     
+    # Series downloads kept on disk between runs (FRED releases are daily/weekly)
+    DISK_CACHE_FILE = Path('data/fred_series_cache.json')
+    DISK_CACHE_TTL = timedelta(days=1)
+    # Serializes read-modify-write of DISK_CACHE_FILE across concurrent fetches
+    _disk_cache_lock = threading.Lock()
+    
     def __init__(self):
         super().__init__()
         self._fred = None
@@ -46,6 +56,7 @@ class FREDSource(APIDataSource):
     def fred(self):
         """Lazy initialization of FRED client."""
         if self._fred is None:
+            load_env()
             self._fred = Fred(api_key=os.getenv('FRED_API_KEY'))
         return self._fred
     
@@ -85,11 +96,15 @@ class FREDSource(APIDataSource):
             end_date = datetime.now()
             start_date = end_date - self._period_to_timedelta(period_lower)
             
-            series_data = self.fred.get_series(
-                symbol,
-                observation_start=start_date.strftime('%Y-%m-%d'),
-                observation_end=end_date.strftime('%Y-%m-%d')
-            )
+            series_data = self._load_disk_cache(symbol, start_date)
+            if series_data is None:
+                series_data = self.fred.get_series(
+                    symbol,
+                    observation_start=start_date.strftime('%Y-%m-%d'),
+                    observation_end=end_date.strftime('%Y-%m-%d')
+                )
+                if not series_data.empty:
+                    self._save_disk_cache(symbol, series_data, start_date)
             
             if series_data.empty:
                 raise ValueError(f"No FRED data found for {symbol} with period {period_lower}")
@@ -133,6 +148,57 @@ class FREDSource(APIDataSource):
             'config': config
         }
           
+    def _load_disk_cache(self, symbol: str, start_date: datetime) -> pd.Series | None:
+        """Load a series downloaded within DISK_CACHE_TTL that covers start_date (None on miss)."""
+        try:
+            with self._disk_cache_lock, open(self.DISK_CACHE_FILE, 'r') as f:
+                entry = json.load(f).get(symbol)
+        except (OSError, ValueError):
+            return None
+        if not entry:
+            return None
+        
+        fetched_at = datetime.fromisoformat(entry['fetched_at'])
+        if datetime.now() - fetched_at > self.DISK_CACHE_TTL or entry['start'] > start_date.strftime('%Y-%m-%d'):
+            return None
+        
+        series = pd.Series(entry['values'], index=pd.DatetimeIndex(entry['dates']), dtype='float64')
+        series = series[series.index >= start_date.strftime('%Y-%m-%d')]
+        print(f"[FRED][CACHE] Using disk cache: symbol={symbol}, fetched_at={entry['fetched_at']}")
+        return series
+    
+    def _save_disk_cache(self, symbol: str, series_data: pd.Series, start_date: datetime):
+        """Store a downloaded series on disk (one entry per symbol, replaced on each download).
+        
+        The file is rewritten through a temp file and os.replace, so readers never see a partial write.
+        """
+        entry = {
+            'fetched_at': datetime.now().isoformat(timespec='seconds'),
+            'start': start_date.strftime('%Y-%m-%d'),
+            'dates': series_data.index.strftime('%Y-%m-%d').tolist(),
+            # NaN (missing observation) -> null
+            'values': series_data.astype('float64').replace({float('nan'): None}).tolist()
+        }
+        with self._disk_cache_lock:
+            try:
+                with open(self.DISK_CACHE_FILE, 'r') as f:
+                    all_data = json.load(f)
+            except (OSError, ValueError):
+                all_data = {}
+            all_data[symbol] = entry
+            
+            tmp_path = None
+            try:
+                self.DISK_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+                with tempfile.NamedTemporaryFile('w', dir=self.DISK_CACHE_FILE.parent, suffix='.tmp', delete=False) as f:
+                    tmp_path = f.name
+                    json.dump(all_data, f)
+                os.replace(tmp_path, self.DISK_CACHE_FILE)
+            except OSError as e:
+                print(f"[FRED][CACHE] Could not write disk cache: {e}")
+                if tmp_path and os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+    
     async def create_chart(self, data: dict[str, Any], symbol: str, period: str, label: str = None, chart_type: str = 'line', **kwargs) -> str:
         """Create FRED indicator chart.
         
@@ -154,9 +220,11 @@ class FREDSource(APIDataSource):
     def get_analysis(self, data: dict[str, Any], period: str) -> dict[str, Any]:
         """Extract analysis metrics from FRED data."""
         series_data = data['data']
+        # Read the endpoints and range from one ndarray instead of separate pandas indexer calls
+        values = series_data.to_numpy(dtype='float64')
         
-        start_value = float(series_data.iloc[0])
-        end_value = float(series_data.iloc[-1])
+        start_value = float(values[0])
+        end_value = float(values[-1])
         change_pct = ((end_value - start_value) / start_value) * 100
         
         return {
@@ -164,8 +232,8 @@ class FREDSource(APIDataSource):
             'start': start_value,
             'end': end_value,
             'change_pct': change_pct,
-            'high': float(series_data.max()),
-            'low': float(series_data.min()),
+            'high': float(np.nanmax(values)),
+            'low': float(np.nanmin(values)),
             'volatility': float(series_data.pct_change(fill_method=None).std() * (len(series_data) ** 0.5) * 100)
         }
 
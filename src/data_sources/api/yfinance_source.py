@@ -1,20 +1,60 @@
 """YFinance data source for stocks, ETFs, and treasuries."""
 
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import yfinance as yf
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pandas.tseries.offsets import BDay
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
-from src.data_sources.base import APIDataSource
+from src.data_sources.base import APIDataSource, PERIOD_TIMEDELTAS
 from src.utils.charts import create_yfinance_chart, create_line_chart
-from src.utils.technical_indicators import calculate_sma
+from src.utils.technical_indicators import calculate_smas
+
+# Ticker names that are charted as yields rather than prices
+_TREASURY_RE = re.compile(r'TREASURY|YIELD|INTEREST', re.IGNORECASE)
+
+# Info subsets for CBOE yield indexes (the only '^' symbols _get_chart_config must not treat as plain indexes)
+_YIELD_INDEX_INFO = MappingProxyType({
+    '^IRX': MappingProxyType({'longName': '13 Week Treasury Bill', 'quoteType': 'INDEX'}),
+    '^FVX': MappingProxyType({'longName': 'Treasury Yield 5 Years', 'quoteType': 'INDEX'}),
+    '^TNX': MappingProxyType({'longName': 'CBOE Interest Rate 10 Year T No', 'quoteType': 'INDEX'}),
+    '^TYX': MappingProxyType({'longName': 'Treasury Yield 30 Years', 'quoteType': 'INDEX'}),
+})
+
+
+def _known_info(symbol: str) -> dict | None:
+    """Info for symbols whose chart config is known from the symbol alone (None if ticker.info is needed)."""
+    if symbol in _YIELD_INDEX_INFO:
+        return dict(_YIELD_INDEX_INFO[symbol])
+    if symbol.startswith('^'):
+        return {'longName': symbol, 'quoteType': 'INDEX'}
+    return None
+
+
+@lru_cache(maxsize=16)
+def _price_config(currency: str) -> Mapping[str, str]:
+    """Chart config for price tickers, built once per currency (read-only, shared between calls)."""
+    return MappingProxyType({
+        'ylabel': f'Price ({currency})',
+        'value_format': f'{currency} {{}}'
+    })
 
 
 class YFinanceSource(APIDataSource):
     """Data source for stocks, ETFs, and treasuries via yfinance."""
     
     _cache: dict[str, Any] = {}
+    # {symbol: lock} - serializes fetches of the same symbol
+    _fetch_locks: dict[str, threading.Lock] = {}
+    
+    MAX_CONCURRENT_FETCHES = 5
+    # Ticker info requests run here so they overlap the history download
+    _info_executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_FETCHES, thread_name_prefix='yf-info')
     
     def __init__(self):
         """Initialize with smart cache for API optimization."""
@@ -22,22 +62,11 @@ class YFinanceSource(APIDataSource):
     
     def _period_to_timedelta(self, period: str) -> timedelta:
         """Convert yfinance period string to approximate timedelta for display window."""
-        period_map = {
-            '5d': timedelta(days=7),
-            '1mo': timedelta(days=30),
-            '3mo': timedelta(days=90),
-            '6mo': timedelta(days=182),
-            '1y': timedelta(days=365),
-            '2y': timedelta(days=730),
-            '5y': timedelta(days=1825),
-            '10y': timedelta(days=3650),
-            'max': timedelta(days=36500),
-        }
         period_lower = period.lower()
-        if period_lower not in period_map:
+        if period_lower not in PERIOD_TIMEDELTAS:
             print(f"Warning: Unsupported period '{period}', using default 6mo (200 days)")
             return timedelta(days=200)
-        return period_map[period_lower]
+        return PERIOD_TIMEDELTAS[period_lower]
     
     def fetch_data(self, symbol: str, period: str) -> dict[str, Any]:
         """Fetch data from yfinance with intelligent caching."""
@@ -51,67 +80,67 @@ class YFinanceSource(APIDataSource):
                 print(f"[YF][WARN] Empty period for {symbol}; defaulting to '1y'")
                 period_lower = '1y'
         
-        if self._should_fetch(symbol, period_lower):
-            print(f"[YF][API] Fetching data: symbol={symbol}, period={period_lower}")
-            ticker = yf.Ticker(symbol)
-            end_date = datetime.now()
-            
-            if period_lower == 'max':
-                hist = ticker.history(period='max')
-            else:
-                display_delta = self._period_to_timedelta(period_lower)
-                start_display = end_date - display_delta
+        # One download per symbol at a time: concurrent calls (load_data runs in threads) wait and reuse its result
+        with self._fetch_locks.setdefault(symbol, threading.Lock()):
+            cached = self._cache.get(symbol)
+            if self._should_fetch(symbol, period_lower):
+                print(f"[YF][API] Fetching data: symbol={symbol}, period={period_lower}")
+                ticker = yf.Ticker(symbol)
+                end_date = datetime.now()
                 
-                max_window = 20 if period_lower in ['1mo', '3mo'] else 200
-                safety_margin = 20
-                fetch_start = pd.Timestamp(start_display.date()) - BDay(max_window + safety_margin)
-                hist = ticker.history(start=fetch_start, end=end_date)
-            
-            if hist.empty:
-                raise ValueError(f"No data found for {symbol} with period {period_lower}")
-            
-            # Normalize timezone
-            try:
-                hist.index = hist.index.tz_localize(None)
-            except (TypeError, AttributeError):
-                pass
-            
-            # Get info
-            info = {}
-            if cached and 'info' in cached:
-                info = cached['info']
-            else:
+                # Start the info request now so it overlaps the history download
+                # (index symbols skip it: their chart config doesn't depend on ticker.info)
+                info_future = None
+                known_info = _known_info(symbol)
+                if known_info is None and not (cached and 'info' in cached):
+                    info_future = self._info_executor.submit(self._fetch_info, ticker, symbol)
+                
+                if period_lower == 'max':
+                    hist = ticker.history(period='max')
+                else:
+                    display_delta = self._period_to_timedelta(period_lower)
+                    start_display = end_date - display_delta
+                
+                    max_window = 20 if period_lower in ['1mo', '3mo'] else 200
+                    safety_margin = 20
+                    fetch_start = pd.Timestamp(start_display.date()) - BDay(max_window + safety_margin)
+                    hist = ticker.history(start=fetch_start, end=end_date)
+                
+                if hist.empty:
+                    raise ValueError(f"No data found for {symbol} with period {period_lower}")
+                
+                # Normalize timezone
                 try:
-                    info = getattr(ticker, 'info', {}) or {}
-                except Exception as e:
-                    # Some symbols (like DX-Y.NYB) may not have info, but history works
-                    print(f"[YF][WARN] Could not fetch info for {symbol}: {type(e).__name__}: {str(e)}")
-                    info = {}
+                    hist.index = hist.index.tz_localize(None)
+                except (TypeError, AttributeError):
+                    pass
+                
+                # Get info
+                if info_future is not None:
+                    info = info_future.result()
+                else:
+                    info = known_info if known_info is not None else cached['info']
+                
+                self._cache[symbol] = {
+                    'hist': hist,
+                    'info': info,
+                    'period': period_lower,
+                    'fetched_at': datetime.now()
+                }
+                cached = self._cache[symbol]
+            else:
+                if cached:
+                    print(f"[YF][CACHE] Using cached data: symbol={symbol}, cached_period={cached['period']} → requested={period_lower}")
             
-            self._cache[symbol] = {
-                'hist': hist,
-                'info': info,
-                'period': period_lower,
-                'fetched_at': datetime.now()
-            }
-            cached = self._cache[symbol]
-        else:
-            if cached:
-                print(f"[YF][CACHE] Using cached data: symbol={symbol}, cached_period={cached['period']} → requested={period_lower}")
-        
-        hist = cached['hist']
-        info = cached['info']
-        
-        # Compute SMA columns
-        if 'Close' in hist.columns:
-            if 'SMA_5' not in hist.columns:
-                hist['SMA_5'] = calculate_sma(hist, 5)
-            if 'SMA_20' not in hist.columns:
-                hist['SMA_20'] = calculate_sma(hist, 20)
-            if 'SMA_50' not in hist.columns:
-                hist['SMA_50'] = calculate_sma(hist, 50)
-            if 'SMA_200' not in hist.columns:
-                hist['SMA_200'] = calculate_sma(hist, 200)
+            hist = cached['hist']
+            info = cached['info']
+            
+            # Compute SMA columns (once per cached history, all windows from one pass)
+            if 'Close' in hist.columns:
+                missing_windows = [w for w in (5, 20, 50, 200) if f'SMA_{w}' not in hist.columns]
+                if missing_windows:
+                    for window, sma in calculate_smas(hist, missing_windows).items():
+                        hist[f'SMA_{window}'] = sma
 
         # Slice to requested period
         if period_lower == 'max':
@@ -136,6 +165,16 @@ class YFinanceSource(APIDataSource):
             'symbol': symbol
         }
     
+    @staticmethod
+    def _fetch_info(ticker, symbol: str) -> dict:
+        """Fetch ticker info (runs on the info executor, alongside the history download)."""
+        try:
+            return getattr(ticker, 'info', {}) or {}
+        except Exception as e:
+            # Some symbols (like DX-Y.NYB) may not have info, but history works
+            print(f"[YF][WARN] Could not fetch info for {symbol}: {type(e).__name__}: {str(e)}")
+            return {}
+    
     async def create_chart(self, data: dict[str, Any], symbol: str, period: str, label: str = None, chart_type: str = 'candle', **kwargs) -> str:
         """Create stock/treasury chart.
         
@@ -174,13 +213,13 @@ class YFinanceSource(APIDataSource):
         else:
             raise ValueError(f"Unsupported chart_type: {chart_type}. Use 'candle' or 'line'.")
     
-    def _get_chart_config(self, symbol: str, info: dict) -> dict:
+    def _get_chart_config(self, symbol: str, info: dict) -> Mapping[str, str]:
         """Get chart configuration for yfinance data."""
         ticker_name = info.get('longName', symbol)
         quote_type = info.get('quoteType', 'EQUITY')
         currency = info.get('currency', 'USD')
         
-        if any(keyword in ticker_name.upper() for keyword in ['TREASURY', 'YIELD', 'INTEREST']):
+        if _TREASURY_RE.search(ticker_name):
             return {
                 'ylabel': 'Yield (%)',
                 'value_format': '{:.3f}%'
@@ -191,10 +230,7 @@ class YFinanceSource(APIDataSource):
                 'value_format': '{:.2f}'
             }
         else:
-            return {
-                'ylabel': f'Price ({currency})',
-                'value_format': f'{currency} {{}}'
-            }
+            return _price_config(currency)
     
     def get_analysis(self, data: dict[str, Any], period: str) -> dict[str, Any]:
         """Extract basic analysis metrics from yfinance data."""
@@ -4,18 +4,43 @@ Base classes for data sources.
 Provides abstract base classes for API and Web scraping data sources.
 """
 
+import numpy as np
 import pandas as pd
 import json
 import asyncio
+import requests
+import weakref
 from abc import ABC, abstractmethod
+from bs4 import SoupStrainer
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from typing import Any
 from pathlib import Path
 
 
+# Display window for each supported period string (shared by all sources)
+PERIOD_TIMEDELTAS = MappingProxyType({
+    '5d': timedelta(days=7),
+    '1mo': timedelta(days=30),
+    '3mo': timedelta(days=90),
+    '6mo': timedelta(days=182),
+    '1y': timedelta(days=365),
+    '2y': timedelta(days=730),
+    '5y': timedelta(days=1825),
+    '10y': timedelta(days=3650),
+    'max': timedelta(days=36500),
+})
+
+
 class DataSource(ABC):
     """Base class for all data sources."""
     
+    # Max concurrent load_data() calls per source class, i.e. per upstream host
+    MAX_CONCURRENT_FETCHES = 4
+    
+    # {event loop: {source class: asyncio.Semaphore}} - semaphores are bound to the loop that uses them
+    _fetch_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+    
     def __init__(self):
         """Initialize data source."""
         pass
@@ -56,6 +81,9 @@ class DataSource(ABC):
         """
         Async wrapper for fetch_data - runs sync fetch_data in thread pool.
         
+        At most MAX_CONCURRENT_FETCHES calls per source class run at once, so a burst of
+        parallel tool calls does not trip the upstream rate limit.
+        
         Args:
             symbol: Symbol or indicator code
             period: Time period (5d, 1mo, 6mo, etc.)
@@ -63,7 +91,16 @@ class DataSource(ABC):
         Returns:
             Dictionary with data and metadata
         """
-        return await asyncio.to_thread(self.fetch_data, symbol, period)
+        async with self._get_fetch_semaphore():
+            return await asyncio.to_thread(self.fetch_data, symbol, period)
+    
+    def _get_fetch_semaphore(self) -> asyncio.Semaphore:
+        """Get the semaphore limiting concurrent fetches for this source class on the running loop."""
+        loop_semaphores = DataSource._fetch_semaphores.setdefault(asyncio.get_running_loop(), {})
+        source_cls = type(self)
+        if source_cls not in loop_semaphores:
+            loop_semaphores[source_cls] = asyncio.Semaphore(self.MAX_CONCURRENT_FETCHES)
+        return loop_semaphores[source_cls]
     
     @abstractmethod
     async def create_chart(self, data: dict[str, Any], symbol: str, period: str, label: str = None) -> str:
@@ -158,16 +195,82 @@ class WebDataSource(DataSource):
         'Upgrade-Insecure-Requests': '1'
     }
     
+    # Scraped pages only need their <table> subtrees; skip building Tag objects for the rest
+    TABLE_STRAINER = SoupStrainer('table')
+    
+    # Upper bound on bytes read from a scraped page
+    MAX_SCRAPE_BYTES = 2 * 1024 * 1024
+    
+    # Window used when the period string is not in PERIOD_TIMEDELTAS
+    DEFAULT_PERIOD_DELTA = timedelta(days=365)
+    
+    # {(cache file, symbol): ((st_mtime_ns, st_size), series, is_validated)}
+    # Parsed local cache reused by later fetches while the JSON file is unchanged
+    _parsed_cache_memo: dict[tuple[Path, str], tuple[tuple[int, int], pd.Series, bool]] = {}
+    
     def __init__(self):
         """Initialize with file-based cache."""
         super().__init__()
         self._cache_file: Path | None = None
     
+    def _period_to_timedelta(self, period: str) -> timedelta:
+        """Convert period string to timedelta."""
+        return PERIOD_TIMEDELTAS.get((period or '1y').lower(), self.DEFAULT_PERIOD_DELTA)
+    
+    @staticmethod
+    def _build_series(dates: list, values: list[float]) -> pd.Series:
+        """Build a date-sorted Series from parallel date/value lists (last value wins on duplicate dates)."""
+        series = pd.Series(values, index=pd.DatetimeIndex(dates), dtype='float64')
+        return series[~series.index.duplicated(keep='last')].sort_index()
+    
+    def _fetch_html(self, url: str, table_marker: bytes | None = b'<table', stop_after: bytes = b'</table>') -> str:
+        """
+        Download a page in chunks and stop once the target table has been received.
+        
+        Args:
+            url: Page URL
+            table_marker: Lowercase opening bytes of the target table (e.g. b'<table id="history"');
+                reading stops at the first stop_after following it (None reads the whole page)
+            stop_after: Lowercase end marker searched for after table_marker
+            
+        Returns:
+            Decoded HTML received so far (at most about MAX_SCRAPE_BYTES)
+        """
+        with requests.get(url, headers=self.BROWSER_HEADERS, timeout=15, stream=True) as response:
+            response.raise_for_status()
+            body = bytearray()
+            lowered = bytearray()
+            table_start = -1
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                # Re-scan the end of the previous chunk so a marker split across chunks is still found
+                scan_from = max(0, len(lowered) - len(stop_after))
+                body += chunk
+                lowered += chunk.lower()
+                if table_marker:
+                    if table_start < 0:
+                        table_start = lowered.find(table_marker, max(0, scan_from - len(table_marker)))
+                        scan_from = table_start
+                    if table_start >= 0 and lowered.find(stop_after, max(scan_from, table_start)) >= 0:
+                        break
+                if len(body) >= self.MAX_SCRAPE_BYTES:
+                    print(f"[{type(self).__name__}] Warning: stopped reading {url} at MAX_SCRAPE_BYTES ({self.MAX_SCRAPE_BYTES:,} bytes); scraped data may be incomplete")
+                    break
+            return bytes(body).decode(response.encoding or 'utf-8', errors='replace')
+    
     def _load_local_cache(self, symbol: str, log_prefix: str) -> tuple[pd.Series | None, bool]:
         """Load historical data from local JSON file (unified for all web sources)."""
         if not self._cache_file.exists():
             print(f"[{log_prefix}][CACHE] Cache file not found: {self._cache_file}")
             return None, False
+        
+        stat = self._cache_file.stat()
+        file_version = (stat.st_mtime_ns, stat.st_size)
+        memo = WebDataSource._parsed_cache_memo.get((self._cache_file, symbol))
+        if memo is not None and memo[0] == file_version:
+            _, series, is_validated = memo
+            print(f"[{log_prefix}][CACHE] Reusing parsed cache for {symbol}, latest: {series.index[-1].date()}, validated: {is_validated}")
+            return series, is_validated
+        
         try:
             with open(self._cache_file, 'r') as f:
                 all_data = json.load(f)
@@ -195,6 +298,7 @@ class WebDataSource(DataSource):
                 return None, False
             
             series = pd.Series(data_dict).sort_index()
+            WebDataSource._parsed_cache_memo[(self._cache_file, symbol)] = (file_version, series, is_validated)
             
             print(f"[{log_prefix}][CACHE] Loaded {len(series)} records for {symbol}, latest: {series.index[-1].date()}, validated: {is_validated}")
             return series, is_validated
@@ -215,18 +319,18 @@ class WebDataSource(DataSource):
         # Filter out NaN values - don't save NaN, preserve existing good values
         # Also remove duplicate dates (keep last occurrence)
         symbol_data_dict = {}
-        existing_dates = set()
-        if symbol in all_data:
-            existing_dates = {item['date'] for item in all_data[symbol]}
+        # {date_str: item} - lookup for existing records (avoids a list scan per NaN date)
+        existing_items = {item['date']: item for item in all_data.get(symbol, [])}
         
-        for d, v in data.items():
-            date_str = d.strftime('%Y-%m-%d')
-            if pd.notna(v):  # Only save non-NaN values
+        # Format all dates at once instead of strftime per record
+        date_strs = data.index.strftime('%Y-%m-%d')
+        for date_str, v in zip(date_strs, data.to_numpy(dtype='float64', na_value=np.nan)):
+            if not np.isnan(v):  # Only save non-NaN values
                 symbol_data_dict[date_str] = {'date': date_str, 'value': float(v)}
-            elif date_str in existing_dates:
+            elif date_str in existing_items:
                 # Keep existing value if it exists and new value is NaN
-                existing_item = next((item for item in all_data[symbol] if item['date'] == date_str), None)
-                if existing_item and pd.notna(existing_item.get('value')):
+                existing_item = existing_items[date_str]
+                if pd.notna(existing_item.get('value')):
                     symbol_data_dict[date_str] = existing_item
                     print(f"[{log_prefix}][CACHE] Preserved existing value for {date_str} (new value was NaN)")
         
@@ -241,8 +345,19 @@ class WebDataSource(DataSource):
         with open(self._cache_file, 'w') as f:
             json.dump(all_data, f, indent=2)
         
+        # The file changed, so drop parsed copies of it (don't rely on mtime granularity alone)
+        for key in [key for key in WebDataSource._parsed_cache_memo if key[0] == self._cache_file]:
+            WebDataSource._parsed_cache_memo.pop(key, None)
+        
         print(f"[{log_prefix}][CACHE] Saved {len(symbol_data)} records for {symbol}, validated: {is_validated}")
     
+    def _slice_to_period(self, merged: pd.Series, period: str) -> pd.Series:
+        """Slice data to the requested period (falls back to all data if the window is empty)."""
+        start_date = datetime.now() - self._period_to_timedelta(period)
+        period_data = merged[merged.index >= start_date]
+        print(f"[CACHE][RETURN] Returning {len(period_data)} records for period {period}")
+        return period_data if len(period_data) > 0 else merged
+    
     def _fetch_with_cache_and_scrape(
         self,
         symbol: str,
@@ -281,13 +396,7 @@ class WebDataSource(DataSource):
             latest_cached_date = local.index[-1].date()
             if latest_cached_date >= last_bday:
                 print(f"[CACHE] Up-to-date (cached: {latest_cached_date} >= last bday: {last_bday}), skipping scrape")
-                merged = local
-                # Skip to return section
-                end_date = datetime.now()
-                start_date = end_date - self._period_to_timedelta(period)
-                period_data = merged[merged.index >= start_date]
-                print(f"[CACHE][RETURN] Returning {len(period_data)} records for period {period}")
-                return build_result_fn(period_data if len(period_data) > 0 else merged, merged)
+                return build_result_fn(self._slice_to_period(local, period), local)
         
         # Scrape to check latest available date
         print(f"[SCRAPE] Fetching data")
@@ -299,12 +408,7 @@ class WebDataSource(DataSource):
             # If scraping fails and we have cache, use cache
             if local is not None and len(local) > 0:
                 print(f"[CACHE] Using cached data due to scrape failure")
-                merged = local
-                end_date = datetime.now()
-                start_date = end_date - self._period_to_timedelta(period)
-                period_data = merged[merged.index >= start_date]
-                print(f"[CACHE][RETURN] Returning {len(period_data)} records for period {period}")
-                return build_result_fn(period_data if len(period_data) > 0 else merged, merged)
+                return build_result_fn(self._slice_to_period(local, period), local)
             else:
                 # No cache and scraping failed
                 raise ValueError(f"Failed to fetch data: {e}")
@@ -373,12 +477,5 @@ class WebDataSource(DataSource):
             # Save with validation flag (validated)
             save_cache_fn(merged, is_validated=True)
         
-        # Slice to requested period
-        end_date = datetime.now()
-        start_date = end_date - self._period_to_timedelta(period)
-        period_data = merged[merged.index >= start_date]
-        
-        print(f"[CACHE][RETURN] Returning {len(period_data)} records for period {period}")
-        
-        return build_result_fn(period_data if len(period_data) > 0 else merged, merged)
+        return build_result_fn(self._slice_to_period(merged, period), merged)
 
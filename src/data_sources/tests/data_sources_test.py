@@ -2,6 +2,10 @@
 
 import unittest
 import asyncio
+import tempfile
+import time
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 from datetime import datetime, timedelta
 from unittest.mock import patch, MagicMock
@@ -158,6 +162,34 @@ class TestYFinanceSource(unittest.TestCase):
         
         asyncio.run(run())
     
+    @patch('yfinance.Ticker')
+    def test_concurrent_fetch_downloads_once(self, mock_ticker_class):
+        """Concurrent fetches of the same symbol share one download"""
+        YFinanceSource._cache.pop("CONC", None)
+        mock_ticker = MagicMock()
+        mock_ticker.history.side_effect = lambda **kwargs: time.sleep(0.1) or self.mock_data_1y['data'].copy()
+        mock_ticker_class.return_value = mock_ticker
+        
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: self.source.fetch_data("CONC", "1y"), range(4)))
+        
+        self.assertEqual(mock_ticker.history.call_count, 1)
+        self.assertTrue(all(len(r['data']) == len(results[0]['data']) for r in results))
+
+    @patch.object(YFinanceSource, '_fetch_info')
+    @patch('yfinance.Ticker')
+    def test_index_symbol_skips_info(self, mock_ticker_class, mock_fetch_info):
+        """Index symbols get their chart config without a ticker.info request"""
+        YFinanceSource._cache.pop("^TNX", None)
+        mock_ticker = MagicMock()
+        mock_ticker.history.return_value = self.mock_data_1y['data'].copy()
+        mock_ticker_class.return_value = mock_ticker
+
+        data = self.source.fetch_data("^TNX", "1y")
+
+        mock_fetch_info.assert_not_called()
+        self.assertEqual(self.source._get_chart_config("^TNX", data['info'])['ylabel'], 'Yield (%)')
+
     def test_get_analysis(self):
         """Test analysis metrics extraction (without technical indicators)"""
         # Use mock data directly
@@ -188,6 +220,14 @@ class TestFREDSource(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures"""
         self.source = FREDSource()
+        FREDSource._cache.clear()
+        
+        # Keep the disk cache out of data/
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        disk_cache_patch = patch.object(FREDSource, 'DISK_CACHE_FILE', Path(cache_dir.name) / 'fred_series_cache.json')
+        disk_cache_patch.start()
+        self.addCleanup(disk_cache_patch.stop)
         
         # Create mock FRED data
         self.mock_fred_data = {
@@ -211,6 +251,26 @@ class TestFREDSource(unittest.TestCase):
         
         asyncio.run(run())
     
+    @patch.dict('os.environ', {'FRED_API_KEY': 'test'})
+    @patch('fredapi.Fred.get_series')
+    def test_disk_cache_reused(self, mock_get_series):
+        """Test a fresh on-disk series is reused instead of calling the API again"""
+        recent = pd.Series([0.1, None, 0.3], index=pd.date_range(datetime.now() - timedelta(days=30), periods=3, freq='W'))
+        mock_get_series.return_value = recent
+        
+        self.source.fetch_data("NFCI", "6mo")
+        FREDSource._cache.clear()
+        data = FREDSource().fetch_data("NFCI", "6mo")
+        
+        self.assertEqual(mock_get_series.call_count, 1)
+        self.assertEqual(len(data['data']), 3)
+        self.assertTrue(pd.isna(data['data'].iloc[1]))
+        
+        # Longer period than the cached download goes back to the API
+        FREDSource._cache.clear()
+        FREDSource().fetch_data("NFCI", "1y")
+        self.assertEqual(mock_get_series.call_count, 2)
+    
     def test_get_analysis(self):
         """Test FRED analysis extraction"""
         # Use mock data directly
@@ -306,6 +366,53 @@ class TestInvestingSource(unittest.TestCase):
         self.assertAlmostEqual(result['current'], 38.56, places=2)
         mock_scrape.assert_called_once()
     
+    @patch('src.data_sources.base.requests.get')
+    def test_scrape_stops_after_first_table(self, mock_get):
+        """Test scraping stops reading the page once the data table is closed"""
+        html = (b"<html><div>header</div><table><tr><th>Date</th><th>Price</th></tr>"
+                b"<tr><td>Oct 14, 2025</td><td>1,055.20</td></tr>"
+                b"<tr><td>Oct 13, 2025</td><td>51.30</td></tr></table>")
+        trailing = [b"<div>footer</div>" * 100] * 5
+        response = MagicMock()
+        response.encoding = 'utf-8'
+        response.iter_content.return_value = iter([html[:40], html[40:]] + trailing)
+        mock_get.return_value.__enter__.return_value = response
+        
+        series = self.source._scrape_data(self.source.SYMBOL_URLS['S5TH'])
+        
+        self.assertEqual(len(series), 2)
+        self.assertAlmostEqual(series.iloc[-1], 1055.20, places=2)
+        # Footer chunks after </table> must not be consumed
+        self.assertEqual(len(list(response.iter_content.return_value)), 5)
+    
+    @patch('src.data_sources.base.requests.get')
+    def test_fetch_html_waits_for_target_table(self, mock_get):
+        """Test a </table> before the target table does not stop reading"""
+        chunks = [b"<script>var s = '</table>';</script>", b"<table id='data'><tr><td>1</td></tr>", b"</table>", b"<div>footer</div>"]
+        response = MagicMock()
+        response.encoding = 'utf-8'
+        response.iter_content.return_value = iter(chunks)
+        mock_get.return_value.__enter__.return_value = response
+        
+        html = self.source._fetch_html('https://example.com', table_marker=b"<table id='data'")
+        
+        self.assertTrue(html.endswith('</table>'))
+        self.assertEqual(len(list(response.iter_content.return_value)), 1)
+    
+    @patch('src.data_sources.base.requests.get')
+    def test_fetch_html_warns_at_byte_cap(self, mock_get):
+        """Test hitting MAX_SCRAPE_BYTES before the table closes stops reading with a warning"""
+        response = MagicMock()
+        response.encoding = 'utf-8'
+        response.iter_content.return_value = iter([b"<table>" + b"x" * 100] * 5)
+        mock_get.return_value.__enter__.return_value = response
+        
+        with patch.object(self.source, 'MAX_SCRAPE_BYTES', 200), patch('builtins.print') as mock_print:
+            html = self.source._fetch_html('https://example.com')
+        
+        self.assertEqual(len(html), 214)
+        self.assertIn('MAX_SCRAPE_BYTES', mock_print.call_args[0][0])
+    
     def test_fetch_data_invalid_symbol(self):
         """Test invalid symbol raises error"""
         source = InvestingSource()
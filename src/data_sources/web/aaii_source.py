@@ -2,10 +2,9 @@
 
 import json
 import pandas as pd
-import requests
 from pathlib import Path
 from bs4 import BeautifulSoup
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Any
 
 from src.data_sources.base import WebDataSource
@@ -19,38 +18,18 @@ class AAIISource(WebDataSource):
         super().__init__()
         self._cache_file = Path('data/aaii_bull_bear_spread_history.json')
     
-    def _period_to_timedelta(self, period: str) -> timedelta:
-        """Convert period string to timedelta."""
-        period_map = {
-            '5d': timedelta(days=7),
-            '1mo': timedelta(days=30),
-            '3mo': timedelta(days=90),
-            '6mo': timedelta(days=182),
-            '1y': timedelta(days=365),
-            '2y': timedelta(days=730),
-            '5y': timedelta(days=1825),
-            '10y': timedelta(days=3650),
-            'max': timedelta(days=36500),
-        }
-        period_lower = period.lower()
-        if period_lower not in period_map:
-            return timedelta(days=365)
-        return period_map[period_lower]
-    
-    
     def _scrape_data(self) -> pd.Series:
         """Scrape latest AAII sentiment data from website."""
         url = 'https://www.aaii.com/sentimentsurvey/sent_results'
-        response = requests.get(url, headers=self.BROWSER_HEADERS, timeout=15)
-        response.raise_for_status()
+        html = self._fetch_html(url)
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(html, 'html.parser', parse_only=self.TABLE_STRAINER)
         table = soup.find('table')
         
         if not table:
             raise ValueError("No data table found on AAII website")
         
-        data = []
+        dates, values = [], []
         current_year = datetime.now().year
         
         for row in table.find_all('tr')[1:]:
@@ -69,15 +48,16 @@ class AAIISource(WebDataSource):
                 bearish = float(cells[3].get_text(strip=True).replace('%', '')) / 100
                 bull_bear_spread = bullish - bearish
                 
-                data.append((date_obj, bull_bear_spread))
+                dates.append(date_obj)
+                values.append(bull_bear_spread)
             except Exception as e:
                 print(f"[AAII][SCRAPE] Error parsing row: {e}")
                 continue
         
-        if not data:
+        if not dates:
             raise ValueError("No valid data scraped from AAII website")
         
-        series = pd.Series(dict(data)).sort_index()
+        series = self._build_series(dates, values)
         print(f"[AAII][SCRAPE] Scraped {len(series)} records, range: {series.index[0].date()} to {series.index[-1].date()}")
         return series
     
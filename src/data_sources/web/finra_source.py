@@ -1,10 +1,8 @@
 """FINRA data source for margin statistics."""
 
 import pandas as pd
-import requests
 from pathlib import Path
 from bs4 import BeautifulSoup
-from datetime import timedelta
 from typing import Any
 
 from src.data_sources.base import WebDataSource
@@ -30,21 +28,6 @@ class FINRASource(WebDataSource):
         self._cache_file = None
         self._current_symbol = None
     
-    def _period_to_timedelta(self, period: str) -> timedelta:
-        """Convert period string to timedelta."""
-        period_map = {
-            '5d': timedelta(days=7),
-            '1mo': timedelta(days=30),
-            '3mo': timedelta(days=90),
-            '6mo': timedelta(days=182),
-            '1y': timedelta(days=365),
-            '2y': timedelta(days=730),
-            '5y': timedelta(days=1825),
-            '10y': timedelta(days=3650),
-            'max': timedelta(days=36500),
-        }
-        return period_map.get(period.lower(), timedelta(days=365))
-    
     def _get_symbol_config(self, symbol: str) -> dict:
         """Get configuration for a symbol."""
         if symbol not in self.SYMBOL_CONFIG:
@@ -57,16 +40,15 @@ class FINRASource(WebDataSource):
         config = self._get_symbol_config(symbol)
         
         url = 'https://www.finra.org/rules-guidance/key-topics/margin-accounts/margin-statistics'
-        response = requests.get(url, headers=self.BROWSER_HEADERS, timeout=15)
-        response.raise_for_status()
+        html = self._fetch_html(url)
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(html, 'html.parser', parse_only=self.TABLE_STRAINER)
         table = soup.find('table')
         
         if not table:
             raise ValueError("No data table found on FINRA website")
         
-        data = []
+        dates, values = [], []
         
         for row in table.find_all('tr')[1:]:  # Skip header
             cells = row.find_all('td')
@@ -81,15 +63,16 @@ class FINRASource(WebDataSource):
                 value_str = cells[config['column_index']].get_text(strip=True).replace(',', '')
                 value = float(value_str)
                 
-                data.append((date_obj, value))
+                dates.append(date_obj)
+                values.append(value)
             except Exception as e:
                 print(f"[FINRA][SCRAPE] Error parsing row: {e}")
                 continue
         
-        if not data:
+        if not dates:
             raise ValueError(f"No valid data scraped from FINRA website for {symbol}")
         
-        series = pd.Series(dict(data)).sort_index()
+        series = self._build_series(dates, values)
         
         # Calculate YoY if configured
         if config['yoy']:
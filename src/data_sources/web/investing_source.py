@@ -1,11 +1,10 @@
 """Investing.com data source for market breadth indicators."""
 
 import json
+import numpy as np
 import pandas as pd
-import requests
 from pathlib import Path
 from bs4 import BeautifulSoup
-from datetime import datetime, timedelta
 from typing import Any
 
 from src.data_sources.base import WebDataSource
@@ -25,38 +24,27 @@ class InvestingSource(WebDataSource):
         'S5FI': 50,
     }
     
+    MAX_CONCURRENT_FETCHES = 2
+    
     def __init__(self):
         super().__init__()
         self._cache_file = Path('data/market_breadth_history.json')
     
-    
     def _scrape_data(self, url: str) -> pd.Series:
         """Scrape market breadth from Investing.com historical data table."""
-        response = requests.get(f"{url}-historical-data", headers=self.BROWSER_HEADERS, timeout=15)
-        response.raise_for_status()
-        table = BeautifulSoup(response.text, 'html.parser').find('table')
+        html = self._fetch_html(f"{url}-historical-data")
+        table = BeautifulSoup(html, 'html.parser', parse_only=self.TABLE_STRAINER).find('table')
         if not table:
             raise ValueError("No data table found")
-        data = [(pd.to_datetime(row.find_all('td')[0].get_text(strip=True), format='%b %d, %Y'),
-                 float(row.find_all('td')[1].get_text(strip=True).replace(',', '')))
-                for row in table.find_all('tr')[1:] if len(row.find_all('td')) >= 2]
-        return pd.Series(dict(data)).sort_index()
-    
-    def _period_to_timedelta(self, period: str) -> timedelta:
-        """Convert period string to timedelta."""
-        period_map = {
-            '5d': timedelta(days=7),
-            '1mo': timedelta(days=30),
-            '3mo': timedelta(days=90),
-            '6mo': timedelta(days=182),
-            '1y': timedelta(days=365),
-            '2y': timedelta(days=730),
-            '5y': timedelta(days=1825),
-            '10y': timedelta(days=3650),
-            'max': timedelta(days=36500),
-        }
-        period_lower = (period or '1y').lower()
-        return period_map.get(period_lower, timedelta(days=365))
+        date_texts, value_texts = [], []
+        for row in table.find_all('tr')[1:]:
+            cells = row.find_all('td')
+            if len(cells) >= 2:
+                date_texts.append(cells[0].get_text(strip=True))
+                value_texts.append(cells[1].get_text(strip=True))
+        # Strip thousands separators and convert all values in one pass
+        values = np.char.replace(np.array(value_texts, dtype=str), ',', '').astype(np.float64)
+        return self._build_series(pd.to_datetime(date_texts, format='%b %d, %Y'), values)
     
     def fetch_data(self, symbol: str, period: str = None) -> dict[str, Any]:
         """Fetch market breadth data with local file caching and validation."""
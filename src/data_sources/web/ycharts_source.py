@@ -2,7 +2,6 @@
 
 import json
 import pandas as pd
-import requests
 from pathlib import Path
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
@@ -19,41 +18,24 @@ class YChartsSource(WebDataSource):
         'CBOE_PUT_CALL_EQUITY': 'https://ycharts.com/indicators/cboe_equity_put_call_ratio',
     }
     
+    DEFAULT_PERIOD_DELTA = timedelta(days=90)  # Default: 3mo
+    
     def __init__(self):
         super().__init__()
         self._cache_file = Path('data/put_call_ratio_history.json')
     
-    def _period_to_timedelta(self, period: str) -> timedelta:
-        """Convert period string to timedelta."""
-        period_map = {
-            '5d': timedelta(days=7),
-            '1mo': timedelta(days=30),
-            '3mo': timedelta(days=90),
-            '6mo': timedelta(days=182),
-            '1y': timedelta(days=365),
-            '2y': timedelta(days=730),
-            '5y': timedelta(days=1825),
-            '10y': timedelta(days=3650),
-            'max': timedelta(days=36500),
-        }
-        period_lower = period.lower()
-        if period_lower not in period_map:
-            return timedelta(days=90)  # Default: 3mo
-        return period_map[period_lower]
-    
-    
     def _scrape_data(self, url: str) -> pd.Series:
         """Scrape Put-Call Ratio from YCharts."""
-        response = requests.get(url, headers=self.BROWSER_HEADERS, timeout=15)
-        response.raise_for_status()
+        # Every 2-column table on the page is read, so only the byte cap applies here
+        html = self._fetch_html(url, table_marker=None)
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(html, 'html.parser', parse_only=self.TABLE_STRAINER)
         tables = soup.find_all('table')
         
         if not tables:
             raise ValueError("No data table found on YCharts")
         
-        data = []
+        dates, values = [], []
         for table in tables:
             rows = table.find_all('tr')
             for row in rows:
@@ -66,15 +48,16 @@ class YChartsSource(WebDataSource):
                         # Try to parse as date and value
                         date_obj = pd.to_datetime(date_text)
                         value = float(value_text)
-                        data.append((date_obj, value))
+                        dates.append(date_obj)
+                        values.append(value)
                     except (ValueError, TypeError):
                         # Not a valid date-value pair, skip
                         continue
         
-        if not data:
+        if not dates:
             raise ValueError("No valid data scraped from YCharts")
         
-        series = pd.Series(dict(data)).sort_index()
+        series = self._build_series(dates, values)
         print(f"[YCHARTS][SCRAPE] Scraped {len(series)} records, range: {series.index[0].date()} to {series.index[-1].date()}")
         return series
     
@@ -6,6 +6,7 @@ Check market conditions to make trading decisions.
 import io
 import os
 import datetime
+from functools import lru_cache
 from PIL import Image
 from dotenv import load_dotenv
 from langchain_core.output_parsers import PydanticOutputParser
@@ -28,17 +29,27 @@ from pydantic import BaseModel
 
 load_dotenv()
 
-#llm = ChatOpenAI(model='gpt-4o', temperature=0.1)
-llm = ChatGoogleGenerativeAI(model='gemini-2.0-flash', temperature=0.1)
-small_llm = ChatOpenAI(model='openai:gpt-4o', temperature=0.1)
+# 클라이언트는 처음 사용할 때 생성 (import 시 env 읽기/API 키 검증 방지)
+@lru_cache(maxsize=1)
+def get_llm():
+    #return ChatOpenAI(model='gpt-4o', temperature=0.1)
+    return ChatGoogleGenerativeAI(model='gemini-2.0-flash', temperature=0.1)
+
+
+@lru_cache(maxsize=1)
+def get_small_llm():
+    return ChatOpenAI(model='openai:gpt-4o', temperature=0.1)
+
 
 # Finnhub API 클라이언트 초기화 (API 키는 환경변수에서 불러옴)
-finnhub_client = finnhub.Client(api_key=os.getenv('FINNHUB_API_KEY'))
+@lru_cache(maxsize=1)
+def get_finnhub():
+    return finnhub.Client(api_key=os.getenv('FINNHUB_API_KEY'))
 
 @tool
 def get_stock_price_from_finnhub(ticker: str) -> dict:
     """Given a stock ticker, return the price data for the past 5 days using Finnhub API"""
-    candles = finnhub_client.stock_candles(ticker, 'D', int((datetime.datetime.now() - datetime.timedelta(days=7)).timestamp()), int(datetime.datetime.now().timestamp()))
+    candles = get_finnhub().stock_candles(ticker, 'D', int((datetime.datetime.now() - datetime.timedelta(days=7)).timestamp()), int(datetime.datetime.now().timestamp()))
     return candles
 
 @tool
@@ -61,13 +72,17 @@ class LiquidityAgent:
     If the trend of a month is up, then the liquidity is good.
     If the trend of a month is down, then the liquidity is bad.
     """
-    liquidity_agent = create_react_agent(
-        llm, tools=[get_stock_price_from_yfinance], prompt=prompt
-    )
+
+    @classmethod
+    @lru_cache(maxsize=1)
+    def get_agent(cls):
+        return create_react_agent(
+            get_llm(), tools=[get_stock_price_from_yfinance], prompt=cls.prompt
+        )
 
     @classmethod
     def check_node(cls, state: MessagesState) -> Command[Literal["supervisor"]]:
-        result = cls.liquidity_agent.invoke(state)
+        result = cls.get_agent().invoke(state)
         return Command(
             update={'messages': [HumanMessage(content=result['messages'][-1].content, name='liquidity_check')]},
             goto='supervisor'
@@ -83,13 +98,17 @@ class OilPriceAgent:
     Get a ticker of WTI (it's not a stock) to get the oil price.
     Check the trend of oil price for a month.
     """
-    oil_price_agent = create_react_agent(
-        llm, tools=[get_stock_price_from_yfinance], prompt=prompt
-    )
+
+    @classmethod
+    @lru_cache(maxsize=1)
+    def get_agent(cls):
+        return create_react_agent(
+            get_llm(), tools=[get_stock_price_from_yfinance], prompt=cls.prompt
+        )
 
     @classmethod
     def check_node(cls, state: MessagesState) -> Command[Literal["supervisor"]]:
-        result = cls.oil_price_agent.invoke(state)
+        result = cls.get_agent().invoke(state)
         return Command(
             update={'messages': [HumanMessage(content=result['messages'][-1].content, name='oil_price_check')]},
             goto='supervisor'
@@ -147,7 +166,7 @@ def supervisor_node(state: MessagesState) -> Command[Literal[*members, "analyst"
                    {"role": "system", "content": system_prompt},
                ] + state["messages"]
     #output_parser = PydanticOutputParser(pydantic_object=Router)
-    response = llm.invoke(messages)
+    response = get_llm().invoke(messages)
     print(response.usage_metadata)
     goto = response.content.strip()
     if goto == "FINISH":
@@ -181,7 +200,7 @@ def analyst_node(state: MessagesState):
     {messages}"""
     )
 
-    analyst_chain = analyst_prompt | llm
+    analyst_chain = analyst_prompt | get_llm()
     result = analyst_chain.invoke({'messages': state['messages'][1:]})  # omit the system prompt
 
     return {'messages': [result]}
@@ -2,20 +2,49 @@
 
 import asyncio
 import logging
+import os
+import httpx
 from datetime import datetime
 from dotenv import load_dotenv
 from agents import trace, set_default_openai_client
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 
 from src.agent.orchestrator.market_report_agent import MarketReportAgent
 from src.adapters.notion_report_builder import NotionReportBuilder
 
 load_dotenv(override=True)
 
-# Suppress httpx INFO logs
-logging.getLogger("httpx").setLevel(logging.WARNING)
-logging.getLogger("httpx._client").setLevel(logging.WARNING)
-logging.getLogger("httpx.client").setLevel(logging.WARNING)
+
+def configure_logging():
+    """Send the project's own (src.*) log records to stderr; the root logger is left to the host."""
+    project_logger = logging.getLogger('src')
+    if not project_logger.handlers:
+        # Plain messages (modules log with emoji prefixes like their print output)
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        project_logger.addHandler(handler)
+    # LOGLEVEL=DEBUG for per-file detail
+    project_logger.setLevel(os.getenv('LOGLEVEL', 'INFO').upper())
+    
+    # Suppress httpx INFO logs
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    logging.getLogger("httpx._client").setLevel(logging.WARNING)
+    logging.getLogger("httpx.client").setLevel(logging.WARNING)
+
+
+def create_openai_client() -> AsyncOpenAI:
+    """
+    OpenAI client for one run. Its connection pool is bound to the running event loop,
+    so it is created inside the loop and closed when the run ends.
+    
+    Timeout is extended to 20 minutes (default is 10 minutes / 600 seconds).
+    Pool limits are sized for sub-agent fan-out.
+    """
+    http_client = DefaultAsyncHttpxClient(
+        limits=httpx.Limits(max_keepalive_connections=50, max_connections=100, keepalive_expiry=30.0),
+        timeout=1200.0
+    )
+    return AsyncOpenAI(timeout=1200.0, http_client=http_client)
 
 
 async def run_market_report():
@@ -44,7 +73,9 @@ async def run_market_report():
             .add_page(final_report)
         
         # Upload to Notion (images are automatically processed)
-        return builder.upload(
+        # Runs in a worker thread so image scanning/uploads and Notion calls don't block the event loop
+        return await asyncio.to_thread(
+            builder.upload,
             title=final_report.title,
             date=datetime.now().strftime('%Y-%m-%d'),
             summary=final_report.summary
@@ -53,20 +84,21 @@ async def run_market_report():
 
 async def main():
     """Main entry point"""
-    # Set OpenAI client with extended timeout (20 minutes)
-    # Default timeout is 10 minutes (600 seconds), increasing to 20 minutes (1200 seconds)
-    client = AsyncOpenAI(timeout=1200.0)
-    set_default_openai_client(client)
-    print("⏱️  OpenAI API timeout set to 20 minutes (1200 seconds)")
-    
-    print("=" * 80)
-    print("Market Report System")
-    print("=" * 80)
+    configure_logging()
     
-    # Example 1: Complete market report
-    print("\n📊 Running complete market report...")
-    market_result = await run_market_report()
-    print(f"Market Report Result: {market_result}")
+    # Set OpenAI client with extended timeout (20 minutes) for this run
+    async with create_openai_client() as openai_client:
+        set_default_openai_client(openai_client)
+        print("⏱️  OpenAI API timeout set to 20 minutes (1200 seconds)")
+        
+        print("=" * 80)
+        print("Market Report System")
+        print("=" * 80)
+        
+        # Example 1: Complete market report
+        print("\n📊 Running complete market report...")
+        market_result = await run_market_report()
+        print(f"Market Report Result: {market_result}")
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -2,16 +2,32 @@
 
 import os
 import io
-import time
+import hashlib
+import logging
 import re
 import glob
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from typing import Dict
 from PIL import Image
 from dotenv import load_dotenv
 
 load_dotenv(override=True)
 
+logger = logging.getLogger(__name__)
+
+# Markdown image patterns in one alternation (image link | normal link | Chart saved), compiled once at import
+_IMAGE_LINK_RE = re.compile(
+    r'(?P<img>!\[(?P<img_alt>[^\]]*)\]\(sandbox:(?P<img_path>[^)]+)\))'
+    r'|(?P<link>\[(?P<link_text>[^\]]+)\]\(sandbox:(?P<link_path>[^)]+)\))'
+    r'|Chart saved:\s+(?P<chart_path>[^\s\n]+\.(?:png|jpg|jpeg))',
+    re.IGNORECASE
+)
+
 
 def find_local_images(content: str) -> tuple[str, list[str], dict[str, str]]:
     """Find local image files in markdown content. Returns (processed_content, image_files, image_map) where:
@@ -19,111 +35,224 @@ def find_local_images(content: str) -> tuple[str, list[str], dict[str, str]]:
     - image_files: list of found image file paths
     - image_map: mapping of file_path to alt_text or link_text
     """
-    processed_content = content
+    processed_contents, image_files, image_map = find_local_images_multi([content])
+    return processed_contents[0], image_files, image_map
+
+
+def find_local_images_multi(contents: list[str]) -> tuple[list[str], list[str], dict[str, str]]:
+    """Find local image files across several markdown pages in a single walk. Returns (processed_contents, image_files, image_map) where:
+    - processed_contents: each page's content with image links replaced by placeholders (same order as contents)
+    - image_files: list of found image file paths across all pages
+    - image_map: mapping of file_path to alt_text or link_text
+    """
     image_files = []
     image_map = {}  # {file_path: alt_text} mapping
-    processed_paths = set()  # Track which paths we've already replaced
-
-    # Parse all image patterns: sandbox links and Chart saved: patterns
-    patterns = [
-        (r'!\[([^\]]*)\]\(sandbox:([^)]+)\)', lambda m: (m.group(2), m.group(1), f'![{m.group(1)}](sandbox:{m.group(2)})')),  # Image links
-        (r'\[([^\]]+)\]\(sandbox:([^)]+)\)', lambda m: (m.group(2), m.group(1), f'[{m.group(1)}](sandbox:{m.group(2)})')),  # Normal links
-        (r'Chart saved:\s+([^\s\n]+\.(?:png|jpg|jpeg))', lambda m: (m.group(1).strip(), None, f'Chart saved: {m.group(1).strip()}'))  # Chart saved pattern
-    ]
-    
-    for pattern, extractor in patterns:
-        matches = re.finditer(pattern, content, re.IGNORECASE)
-        for match in matches:
-            file_path, alt_text, original_text = extractor(match)
-            
-            # For Chart saved pattern, check if file exists before adding to image_files
-            # But always replace placeholder regardless of file existence
-            is_chart_saved = 'Chart saved' in pattern
-            file_exists = os.path.exists(file_path) if is_chart_saved else True
-            
-            if file_path not in image_files and file_exists:
-                image_files.append(file_path)
-            
-            if file_path not in image_map:
-                if alt_text:
-                    image_map[file_path] = alt_text
-                else:
-                    # Use filename as alt text for Chart saved pattern
-                    filename = os.path.basename(file_path)
-                    image_map[file_path] = filename.replace('_', ' ').replace('.png', '').replace('.jpg', '').replace('.jpeg', '')
-            
-            # Replace in content if not already replaced (always replace, even if file doesn't exist)
-            if file_path not in processed_paths:
-                processed_content = processed_content.replace(
-                    original_text,
-                    f'{{{{IMAGE_PLACEHOLDER:{file_path}}}}}',
-                    1
-                )
-                processed_paths.add(file_path)
-
-    # 4. Additionally, search common temp directories for chart images that weren't in the content
+    seen_files = set()  # Membership index for image_files (keeps image_files ordered)
+    processed_contents = [_replace_image_links(content, image_files, image_map, seen_files) for content in contents]
+    _add_temp_chart_files(image_files, image_map, seen_files)
+    return processed_contents, image_files, image_map
+
+
+def _replace_image_links(content: str, image_files: list[str], image_map: dict[str, str], seen_files: set[str]) -> str:
+    """Replace image links in one page with placeholders, collecting found files into image_files/image_map."""
+    processed_paths = set()  # Track which paths we've already replaced in this page
+
+    def _to_placeholder(match: re.Match) -> str:
+        if match.group('img') is not None:  # Image links
+            file_path, alt_text = match.group('img_path'), match.group('img_alt')
+        elif match.group('link') is not None:  # Normal links
+            file_path, alt_text = match.group('link_path'), match.group('link_text')
+        else:  # Chart saved pattern
+            file_path, alt_text = match.group('chart_path').strip(), None
+
+        # For Chart saved pattern, check if file exists before adding to image_files
+        # But always replace placeholder regardless of file existence
+        file_exists = os.path.exists(file_path) if alt_text is None else True
+
+        if file_path not in seen_files and file_exists:
+            seen_files.add(file_path)
+            image_files.append(file_path)
+
+        if file_path not in image_map:
+            if alt_text:
+                image_map[file_path] = alt_text
+            else:
+                # Use filename as alt text for Chart saved pattern
+                image_map[file_path] = _pretty_name(file_path)
+
+        # Only the first occurrence of each path in a page becomes a placeholder
+        if file_path in processed_paths:
+            return match.group(0)
+        processed_paths.add(file_path)
+        return f'{{{{IMAGE_PLACEHOLDER:{file_path}}}}}'
+
+    # Single pass over the page (no per-match str.replace over the whole content)
+    return _IMAGE_LINK_RE.sub(_to_placeholder, content)
+
+
+def _add_temp_chart_files(image_files: list[str], image_map: dict[str, str], seen_files: set[str]) -> None:
+    """Additionally, add chart images from the temp chart directory that weren't in the content."""
+    for chart_file in _find_temp_chart_files():
+        if chart_file not in seen_files:
+            seen_files.add(chart_file)
+            image_files.append(chart_file)
+            # Add to image_map with filename as alt text
+            image_map[chart_file] = _pretty_name(chart_file)
+
+
+def _pretty_name(path: str) -> str:
+    """Filename without extension (any case) and with underscores as spaces, used as alt text."""
+    return os.path.splitext(os.path.basename(path))[0].replace('_', ' ')
+
+
+def _find_temp_chart_files() -> list[str]:
+    """Search common temp directories for chart images."""
     # NOTE: The following patterns cover both Linux (/tmp/market_charts_*) and macOS (/var/folders/*/T/market_charts_*)
     # This ensures chart images are found regardless of OS, since tempfile.mkdtemp(prefix="market_charts_")
     # creates different paths depending on the environment.
     # On macOS, charts are typically saved in /var/folders/.../T/market_charts_xxxxx
     # On Linux or some environments, charts are saved in /tmp/market_charts_xxxxx
-    for pattern in ['/tmp/market_charts_*', '/var/folders/*/T/market_charts_*']:
-        dirs = glob.glob(pattern)
-        if dirs:
-            # Get the most recent directory
-            latest_dir = max(dirs, key=os.path.getmtime)
-            chart_files = glob.glob(f'{latest_dir}/*.png')
-            if chart_files:  # Only process and break if PNG files were actually found
-                for chart_file in chart_files:
-                    if chart_file not in image_files:
-                        image_files.append(chart_file)
-                        # Add to image_map with filename as alt text
-                        filename = os.path.basename(chart_file)
-                        image_map[chart_file] = filename.replace('_', ' ').replace('.png', '')
-                break  # Only break if files were found, otherwise check next pattern
-
-    return processed_content, image_files, image_map
+    chart_files = []
+    for parent_pattern in ['/tmp', '/var/folders/*/T']:
+        latest_dir = _latest_chart_dir(parent_pattern)
+        if latest_dir:
+            with os.scandir(latest_dir) as entries:
+                chart_files = [e.path for e in entries if e.is_file() and e.name.endswith('.png')]
+            if chart_files:  # Only use this directory if PNG files were actually found
+                break  # Otherwise check next pattern
+    return chart_files
 
 
-def upload_images_to_cloudflare(image_files: list[str]) -> dict[str, str]:
-    """Uploads images to Cloudflare R2 and returns a mapping {file_path: url}."""
-    uploaded_map = {}
-    r2_client = boto3.client('s3',
+def _latest_chart_dir(parent_pattern: str) -> str | None:
+    """Return the most recently modified market_charts_* directory under the parent(s), or None."""
+    latest_dir, latest_mtime = None, float('-inf')
+    for parent in glob.glob(parent_pattern):
+        try:
+            # One scandir per parent; DirEntry gives name/type without extra lookups
+            with os.scandir(parent) as entries:
+                for entry in entries:
+                    if entry.name.startswith('market_charts_') and entry.is_dir():
+                        mtime = entry.stat().st_mtime
+                        if mtime > latest_mtime:
+                            latest_dir, latest_mtime = entry.path, mtime
+        except OSError:
+            continue
+    return latest_dir
+
+
+CHART_IMAGE_SIZE = (600, 400)
+CHART_IMAGE_QUALITY = 100
+# BICUBIC is plenty for matplotlib line/bar charts; set CHART_THUMBNAIL_RESAMPLE=lanczos for photographic inputs
+CHART_RESAMPLE = (Image.Resampling.LANCZOS if os.getenv('CHART_THUMBNAIL_RESAMPLE', '').lower() == 'lanczos'
+                  else Image.Resampling.BICUBIC)
+# PNGs already within CHART_IMAGE_SIZE and under this size are uploaded as-is (JPEG-100 is often larger)
+SMALL_IMAGE_MAX_BYTES = 150 * 1024
+# Multipart with parallel parts only kicks in for unexpectedly large images (>5MB)
+R2_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=5 * 1024 * 1024,
+    multipart_chunksize=5 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True
+)
+
+
+# {content hash: public url} - charts already uploaded by this process
+_upload_cache: dict[str, str] = {}
+
+
+@lru_cache(maxsize=1)
+def _get_r2_client():
+    """R2 client built once per process so uploads reuse its keep-alive connection pool."""
+    return boto3.client('s3',
         endpoint_url=f'https://{os.environ["R2_ACCOUNT_ID"]}.r2.cloudflarestorage.com',
         aws_access_key_id=os.environ['R2_ACCESS_KEY_ID'],
         aws_secret_access_key=os.environ['R2_SECRET_ACCESS_KEY'],
-        region_name='auto'
+        region_name='auto',
+        config=Config(
+            max_pool_connections=16,  # >= R2_UPLOAD_CONCURRENCY default (8) plus multipart parts
+            retries={'max_attempts': 5, 'mode': 'adaptive'},
+            tcp_keepalive=True
+        )
     )
-    CHART_IMAGE_SIZE = (600, 400)
-    CHART_IMAGE_QUALITY = 100
 
-    # Upload all chart files as thumbnails
-    for chart_file in image_files:
-        try:
-            print(f"🔄 Starting R2 upload: {chart_file}")
-            filename = os.path.basename(chart_file)
-            # Open the image and resize to thumbnail
-            with Image.open(chart_file) as img:
-                img.thumbnail(CHART_IMAGE_SIZE, Image.Resampling.LANCZOS)
+
+def upload_images_to_cloudflare(image_files: list[str]) -> dict[str, str]:
+    """Uploads images to Cloudflare R2 concurrently and returns a mapping {file_path: url}."""
+    uploaded_map = {}
+    if not image_files:
+        return uploaded_map
+    # One low-level client is thread-safe and shared by all upload workers
+    r2_client = _get_r2_client()
+    max_workers = int(os.getenv('R2_UPLOAD_CONCURRENCY', '8'))
+
+    # Upload all chart files as thumbnails (resize/encode runs in the workers too)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_upload_one, r2_client, chart_file) for chart_file in image_files]
+        for future in as_completed(futures):
+            chart_file, image_url = future.result()
+            if image_url:
+                uploaded_map[chart_file] = image_url
+
+    return uploaded_map
+
+
+def _upload_one(r2_client, chart_file: str) -> tuple[str, str | None]:
+    """Thumbnail one chart and upload it to R2. Returns (chart_file, url), url is None on failure."""
+    try:
+        logger.debug("🔄 Starting R2 upload: %s", chart_file)
+        filename = os.path.basename(chart_file)
+        with open(chart_file, 'rb') as f:
+            data = f.read()
+
+        # Content hash is the object key, so identical charts (any path, any run) map to one object;
+        # the encode settings are part of it so changing them never reuses an object encoded differently
+        digest = hashlib.blake2b(data, digest_size=8)
+        digest.update(repr((CHART_IMAGE_SIZE, CHART_IMAGE_QUALITY, CHART_RESAMPLE)).encode())
+        digest = digest.hexdigest()
+        if digest in _upload_cache:
+            logger.info("♻️ Reusing uploaded chart: %s -> %s", filename, _upload_cache[digest])
+            return chart_file, _upload_cache[digest]
+
+        # Open the image and resize to thumbnail
+        with Image.open(io.BytesIO(data)) as img:
+            if (img.format == 'PNG' and img.width <= CHART_IMAGE_SIZE[0] and img.height <= CHART_IMAGE_SIZE[1]
+                    and len(data) < SMALL_IMAGE_MAX_BYTES):
+                # Small enough already: upload the original PNG bytes
+                object_key, content_type, buffer = f"charts/{digest}.png", 'image/png', io.BytesIO(data)
+            else:
+                # reducing_gap makes thumbnail() call draft() first, so JPEG sources are decoded
+                # at a reduced DCT scale (no-op for PNG) before the final resample
+                img.thumbnail(CHART_IMAGE_SIZE, CHART_RESAMPLE, reducing_gap=2.0)
                 buffer = io.BytesIO()
                 # Convert image to RGB and save as JPEG
                 img.convert('RGB').save(buffer, format='JPEG', quality=CHART_IMAGE_QUALITY, optimize=True)
                 buffer.seek(0)
+                object_key, content_type = f"charts/{digest}.jpg", 'image/jpeg'
 
-                object_key = f"charts/{filename.replace('.png', f'_{int(time.time())}.jpg')}"
-                print(f"📤 Uploading to R2: {object_key}")
-                # 파일 크기 확인
-                file_size_kb = len(buffer.getvalue()) / 1024
-                print(f"📏 Image size: {file_size_kb:.1f} KB")
-                
-                r2_client.upload_fileobj(buffer, os.environ['R2_BUCKET_NAME'], object_key,
-                    ExtraArgs={'ContentType': 'image/jpeg'})
+        bucket = os.environ['R2_BUCKET_NAME']
+        if _object_exists(r2_client, bucket, object_key):
+            logger.debug("♻️ Already in R2: %s", object_key)
+        else:
+            logger.debug("📤 Uploading to R2: %s", object_key)
+            # 파일 크기 확인
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("📏 Image size: %.1f KB", buffer.getbuffer().nbytes / 1024)  # zero-copy view
+            r2_client.upload_fileobj(buffer, bucket, object_key,
+                ExtraArgs={'ContentType': content_type}, Config=R2_TRANSFER_CONFIG)
 
-                image_url = f"{os.environ['R2_PUBLIC_URL']}/{object_key}"
-                uploaded_map[chart_file] = image_url
-                print(f"✅ R2 upload successful: {filename} -> {image_url}")
-        except Exception as e:
-            print(f"❌ R2 upload failed: {chart_file} - {e}")
+        image_url = f"{os.environ['R2_PUBLIC_URL']}/{object_key}"
+        _upload_cache[digest] = image_url
+        logger.info("✅ R2 upload successful: %s -> %s", filename, image_url)
+        return chart_file, image_url
+    except Exception as e:
+        logger.warning("❌ R2 upload failed: %s - %s", chart_file, e)
+        return chart_file, None
 
-    return uploaded_map
 
+def _object_exists(r2_client, bucket: str, object_key: str) -> bool:
+    """Check whether an object is already in the bucket (HEAD request)."""
+    try:
+        r2_client.head_object(Bucket=bucket, Key=object_key)
+        return True
+    except ClientError:
+        return False
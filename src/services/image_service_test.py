@@ -3,7 +3,7 @@
 
 import unittest
 from unittest.mock import patch, MagicMock
-from src.services.image_service import find_local_images, upload_images_to_cloudflare
+from src.services.image_service import find_local_images, find_local_images_multi, upload_images_to_cloudflare
 
 
 class TestImageService(unittest.TestCase):
@@ -47,6 +47,26 @@ class TestImageService(unittest.TestCase):
         self.assertEqual(image_map["/tmp/test3.png"], "이미지 링크")
         print("✅ find_local_images (링크) 테스트 통과")
     
+    @patch('src.services.image_service.os.path.exists')
+    def test_find_local_images_multi(self, mock_exists):
+        """여러 페이지 이미지 한 번에 찾기 테스트"""
+        mock_exists.return_value = True
+        
+        pages = [
+            "![차트1](sandbox:/tmp/test1.png)",
+            "[차트1 다시](sandbox:/tmp/test1.png)\n![차트2](sandbox:/tmp/test2.png)",
+        ]
+        processed_contents, image_files, image_map = find_local_images_multi(pages)
+        
+        self.assertEqual(len(processed_contents), 2)
+        self.assertEqual(processed_contents[0], "{{IMAGE_PLACEHOLDER:/tmp/test1.png}}")
+        # Each page gets its own placeholders even when a path repeats across pages
+        self.assertIn("{{IMAGE_PLACEHOLDER:/tmp/test1.png}}", processed_contents[1])
+        self.assertIn("{{IMAGE_PLACEHOLDER:/tmp/test2.png}}", processed_contents[1])
+        self.assertEqual(image_files[:2], ["/tmp/test1.png", "/tmp/test2.png"])
+        self.assertEqual(image_map["/tmp/test1.png"], "차트1")
+        print("✅ find_local_images_multi 테스트 통과")
+    
     @patch('boto3.client')
     @patch('PIL.Image.open')
     def test_upload_images_to_cloudflare(self, mock_image_open, mock_boto3):
@@ -5,6 +5,9 @@ import pandas as pd
 from src.types.analysis_report import AnalysisReport
 from src.utils.cloudflare import write_csv_to_cloud, read_csv_from_cloud
 
+# Marks "df_existing not given" (None already means "no existing CSV")
+_SENTINEL = object()
+
 
 def collect_scores(results: list[AnalysisReport]) -> dict[str, float]:
     """
@@ -16,21 +19,30 @@ def collect_scores(results: list[AnalysisReport]) -> dict[str, float]:
     Returns:
         Dictionary mapping 'agent_indicator' to score value
     """
-    scores_data = {}
-    for result in results:
-        # Extract score from AnalysisReport (only if score exists and is not empty)
-        if hasattr(result, 'score') and result.score:
-            for score_item in result.score:
-                # Create column name: agent_indicator
-                if score_item.agent == score_item.indicator:
-                    column_name = score_item.agent
-                else:
-                    column_name = f"{score_item.agent}_{score_item.indicator}"
-                scores_data[column_name] = score_item.value
+    # Column name: agent_indicator (just agent when both are the same)
+    scores_data = {
+        (score_item.agent if score_item.agent == score_item.indicator else f"{score_item.agent}_{score_item.indicator}"): score_item.value
+        for result in results
+        for score_item in result.score
+    }
     return scores_data
 
 
-def save_scores_to_csv(results: list[AnalysisReport], cloud_path: str = "indicator/result.csv"):
+def load_existing_scores(cloud_path: str = "indicator/result.csv") -> pd.DataFrame | None:
+    """
+    Load the existing score CSV from cloud storage once, to pass into save_scores_to_csv.
+    
+    Args:
+        cloud_path: Path in cloud storage (default: "indicator/result.csv")
+        
+    Returns:
+        DataFrame of existing scores, or None if the file doesn't exist
+    """
+    return read_csv_from_cloud(cloud_path)
+
+
+def save_scores_to_csv(results: list[AnalysisReport], cloud_path: str = "indicator/result.csv",
+                       df_existing: pd.DataFrame | None = _SENTINEL):
     """
     Collect and save scores from analysis results to CSV in cloud storage.
     
@@ -40,6 +52,8 @@ def save_scores_to_csv(results: list[AnalysisReport], cloud_path: str = "indicat
     Args:
         results: List of AnalysisReport objects from sub-agents
         cloud_path: Path in cloud storage (default: "indicator/result.csv")
+        df_existing: Pre-loaded CSV from load_existing_scores (None = no existing file).
+                     If omitted, the CSV is read from cloud storage.
     """
     try:
         # Collect all scores
@@ -54,38 +68,26 @@ def save_scores_to_csv(results: list[AnalysisReport], cloud_path: str = "indicat
         df_new = pd.DataFrame([scores_data], index=[today])
         df_new.index.name = "date"
         
-        # Try to read existing CSV and append
-        df_existing = read_csv_from_cloud(cloud_path)
+        # Try to read existing CSV (unless the caller already loaded it) and append
+        if df_existing is _SENTINEL:
+            df_existing = read_csv_from_cloud(cloud_path)
         
         if df_existing is not None:
             # Set date as index if it exists as a column
             if 'date' in df_existing.columns:
                 df_existing = df_existing.set_index('date')
             
-            # Append new row, avoiding duplicates
-            if today not in df_existing.index:
-                df_main = pd.concat([df_existing, df_new]) # concat the two dataframes -> concat rows
-            else:
-                # Merge existing row with new row (combine both columns)
-                # New values take precedence, existing values fill missing columns
-                s1 = df_existing.loc[today].copy() # convert to series
-                s2 = df_new.loc[today] # convert to series
-                s1.update(s2)
-                
-                new_only = s2[~s2.index.isin(s1.index)]
-                merged = pd.concat([s1, new_only]) # concat the two series -> concat columns
-                
-                df_existing.loc[today, merged.index] = merged
-                df_main = df_existing
+            # Append new row; on the same date, new values take precedence
+            # and existing values fill missing columns
+            if today in df_existing.index:
+                df_new = df_new.combine_first(df_existing.loc[[today]])
+            df_main = pd.concat([df_existing.drop(index=today, errors='ignore'), df_new])
         else:
             # No existing file, create new one
             df_main = df_new
         
-        # Reset index to have date as a column for CSV
-        df_main = df_main.reset_index()
-        
-        # Save to cloud
-        write_csv_to_cloud(df_main, cloud_path)
+        # Save to cloud (date index is written as the 'date' column)
+        write_csv_to_cloud(df_main, cloud_path, index=True, index_label='date')
         print(f"✅ Scores saved to CSV: {cloud_path}")
         
     except Exception as e:
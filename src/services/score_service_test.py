@@ -115,7 +115,8 @@ class TestSaveScoresToCSV(unittest.TestCase):
         call_args = mock_write.call_args
         df = call_args[0][0]
         
-        self.assertIn('date', df.columns)
+        self.assertEqual(df.index.name, 'date')
+        self.assertEqual(call_args.kwargs, {'index': True, 'index_label': 'date'})
         self.assertIn('VIX', df.columns)
         self.assertEqual(df['VIX'].iloc[0], 3)
     
@@ -183,6 +184,28 @@ class TestSaveScoresToCSV(unittest.TestCase):
         self.assertEqual(df['VIX'].iloc[0], 2)
         self.assertEqual(df['PutCall'].iloc[0], 3)
     
+    @patch('src.services.score_service.write_csv_to_cloud')
+    @patch('src.services.score_service.read_csv_from_cloud')
+    def test_save_scores_with_preloaded_csv(self, mock_read, mock_write):
+        """Test that a pre-loaded CSV is used without reading from cloud"""
+        existing_df = pd.DataFrame({
+            'date': ['2025-01-01'],
+            'VIX': [2]
+        })
+        
+        report = AnalysisReport(
+            title="Test",
+            content="Test",
+            score=[IndicatorScore(agent="VIX", indicator="VIX", value=4)]
+        )
+        
+        save_scores_to_csv([report], cloud_path="test/result.csv", df_existing=existing_df)
+        
+        # Verify read was skipped and both rows were written
+        self.assertFalse(mock_read.called)
+        df = mock_write.call_args[0][0]
+        self.assertEqual(df['VIX'].tolist(), [2, 4])
+    
     @patch('src.services.score_service.write_csv_to_cloud')
     @patch('src.services.score_service.read_csv_from_cloud')
     def test_save_scores_with_no_scores(self, mock_read, mock_write):
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class IndicatorScore(BaseModel):
@@ -7,8 +7,7 @@ class IndicatorScore(BaseModel):
     indicator: str = Field(description="Indicator name (e.g. 'RSI(14)', 'Disparity(200)', 'BullBear')")
     value: int | float = Field(ge=1, le=5, description="Score between 1-5")
     
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
 
 class AnalysisReport(BaseModel):
@@ -25,7 +24,6 @@ class AnalysisReport(BaseModel):
         description="List of indicator scores. Examples: [], [{'indicator':'BullBear','value':3}], [{'indicator':'RSI(14)','value':4},{'indicator':'Disparity(200)','value':3}]"
     )
     
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
 
@@ -1,10 +1,185 @@
+import hashlib
+import io
 import os
+import threading
+from functools import cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-from matplotlib.patches import Rectangle
+from PIL import Image
+from PIL.PngImagePlugin import PngInfo
 from src.config import CHART_OUTPUT_DIR
 
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
+# Period display names
+PERIOD_DISPLAY = MappingProxyType({
+    "5d": "5 Days", "1mo": "1 Month", "3mo": "3 Months", "6mo": "6 Months",
+    "1y": "1 Year", "2y": "2 Years", "5y": "5 Years", "10y": "10 Years"
+})
+# Line color scheme per period
+PERIOD_COLORS = MappingProxyType({"5d": "#1f77b4", "1mo": "#ff7f0e", "6mo": "#2ca02c", "1y": "#d62728", "2y": "#9467bd"})
+# Line series longer than 2x this are downsampled (LTTB) to about the figure's pixel width
+DOWNSAMPLE_TARGET_POINTS = 1000
+# Point markers only for short series; on long series they are per-point stamps nobody can see
+MARKER_MAX_POINTS = 200
+# Fast zlib level for chart PNGs (flat plot images barely shrink at the default level 6)
+PNG_SAVE_OPTIONS = MappingProxyType({'compress_level': 1, 'optimize': False})
+# SMA overlays on candlestick charts: (column, label, linewidth, color, alpha, zorder)
+SMA_OVERLAYS = (
+    ('SMA_5', 'SMA 5', 1.2, '#e377c2', 0.9, 4),
+    ('SMA_50', 'SMA 50', 1.2, '#8c564b', 0.9, 4),
+    ('SMA_200', 'SMA 200', 2.0, '#17becf', 1.0, 5),
+)
+# Filename sanitizing tables (one str.translate pass instead of chained replace), per chart type
+_YFINANCE_NAME_TABLE = str.maketrans({'^': '', '-': '_', ' ': '_', '%': 'pct'})
+_FRED_NAME_TABLE = str.maketrans({' ': '_', '(': '', ')': '', '%': 'pct'})
+_LINE_NAME_TABLE = str.maketrans({'^': '', '-': '_', ' ': '_', '(': '', ')': '', '/': '_', '%': 'pct'})
+# Output directory prefix joined once at import
+_CHART_PATH_PREFIX = os.path.join(CHART_OUTPUT_DIR, '')
+# Common value formats resolved to f-string formatters (no format-spec parsing per call)
+_VALUE_FORMATTERS = MappingProxyType({
+    "{:.2f}": lambda v: f"{v:.2f}",
+    "{:.3f}": lambda v: f"{v:.3f}",
+    "{:.3f}%": lambda v: f"{v:.3f}%",
+})
+
+
+@cache
+def _setup_matplotlib() -> None:
+    """Import and configure matplotlib on the first chart (importing data sources doesn't pay ~0.5s for it)."""
+    import matplotlib
+    matplotlib.use("Agg")  # Headless PNG rendering, no GUI backend probing
+    # Collapse sub-pixel line segments before rasterizing (long multi-year series)
+    matplotlib.rcParams.update({
+        'path.simplify': True,
+        'path.simplify_threshold': 1.0,
+        'agg.path.chunksize': 10000,
+    })
+    # Shared chart text styling and resolution, set once instead of per-artist kwargs
+    # (one concrete font family, so findfont resolves a single font for the process)
+    matplotlib.rcParams.update({
+        'font.family': 'DejaVu Sans',
+        'font.size': 10,
+        'axes.titlesize': 13,
+        'axes.titleweight': 'bold',
+        'axes.labelsize': 11,
+        'legend.fontsize': 9,
+        'figure.dpi': 100,
+        'savefig.dpi': 100,
+    })
+
+
+# Per-thread chart figure, reused across calls (charts may be rendered from worker threads)
+_TLS = threading.local()
+
+
+def _get_figure() -> tuple['Figure', 'Axes']:
+    """Return this thread's 10x4 Agg figure with a cleared axes (built once, not tracked by pyplot)."""
+    if getattr(_TLS, 'fig', None) is None:
+        _setup_matplotlib()
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        _TLS.fig = Figure(figsize=(10, 4))
+        FigureCanvasAgg(_TLS.fig)
+        _TLS.ax = _TLS.fig.add_subplot(111)
+        # Fixed margins for the shared layout (title, ylabel, 45° date ticks) instead of
+        # tight_layout/bbox_inches='tight', which cost an extra measuring render per chart
+        _TLS.fig.subplots_adjust(left=0.08, right=0.97, top=0.90, bottom=0.22)
+    else:
+        _TLS.ax.clear()
+        _TLS.ax.set_prop_cycle(None)
+    return _TLS.fig, _TLS.ax
+
+
+def _lttb(y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+    
+    Args:
+        y: Values (x is taken as the point position; NaN/inf points are never picked)
+        n_out: Number of points to keep
+        
+    Returns:
+        Sorted indices of the kept points (first and last finite points always included)
+    """
+    # Buckets and triangles are built over the finite points only (a NaN would poison the
+    # bucket averages and areas), with their original positions as x
+    x = np.flatnonzero(np.isfinite(y))
+    y = y[x]
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return x
+    
+    # n_out - 2 buckets between the fixed first and last points
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    indices = np.empty(n_out, dtype=int)
+    indices[0], indices[-1] = 0, n - 1
+    prev = 0
+    for b in range(n_out - 2):
+        start, end = edges[b], edges[b + 1]
+        next_start, next_end = (edges[b + 1], edges[b + 2]) if b + 2 < len(edges) else (n - 1, n)
+        avg_x, avg_y = x[next_start:next_end].mean(), y[next_start:next_end].mean()
+        # Pick the point forming the largest triangle with the previous pick and the next bucket's average
+        area = np.abs((x[prev] - avg_x) * (y[start:end] - y[prev]) - (x[prev] - x[start:end]) * (avg_y - y[prev]))
+        prev = start + int(np.argmax(area))
+        indices[b + 1] = prev
+    return x[indices]
+
+
+# PNG text chunk holding the content key a chart file was rendered from
+_CHART_KEY_CHUNK = 'chart_key'
+# Part of every content key: bump when chart styling or drawing code changes so saved PNGs are redrawn
+CHART_RENDER_VERSION = 1
+
+
+def _content_key(data, *params) -> str:
+    """Hash of a chart's data (values, index and column names), its parameters and CHART_RENDER_VERSION."""
+    digest = hashlib.blake2b(pd.util.hash_pandas_object(data).to_numpy().tobytes(), digest_size=8)
+    # hash_pandas_object ignores column/series names
+    names = list(data.columns) if isinstance(data, pd.DataFrame) else data.name
+    digest.update(repr((CHART_RENDER_VERSION, names, params)).encode())
+    return digest.hexdigest()
+
+
+def _is_rendered(filepath: str, key: str) -> bool:
+    """
+    Whether the file at filepath was rendered from the same content key.
+    
+    The key is read from the file itself (PNG text chunk, header only), so a chart overwritten
+    by another process or call with different content is rendered again.
+    """
+    try:
+        with Image.open(filepath) as image:
+            return image.info.get(_CHART_KEY_CHUNK) == key
+    except (OSError, ValueError):
+        return False
+
+
+def _date_labels(dates) -> list[str]:
+    """YYYY-MM-DD labels for a DatetimeIndex in one NumPy call (wall-clock dates for tz-aware indexes)."""
+    return np.datetime_as_string(dates.tz_localize(None).to_numpy(), unit='D').tolist()
+
+
+def _save_figure(fig: 'Figure', filepath: str, key: str):
+    """
+    Render the figure once and encode its RGBA canvas buffer straight to PNG.
+    
+    Skips savefig's print_figure pass (dpi/facecolor swaps, layout, metadata); the file
+    is written through a 1 MiB buffer (one large write instead of many 8 KiB ones).
+    The content key is stored in a text chunk for _is_rendered.
+    """
+    fig.canvas.draw()
+    rgba = fig.canvas.buffer_rgba()  # zero-copy view of the Agg canvas
+    image = Image.frombuffer('RGBA', (rgba.shape[1], rgba.shape[0]), rgba, 'raw', 'RGBA', 0, 1)
+    pnginfo = PngInfo()
+    pnginfo.add_text(_CHART_KEY_CHUNK, key)
+    with open(filepath, 'wb', buffering=0) as raw, io.BufferedWriter(raw, buffer_size=1 << 20) as buf:
+        image.save(buf, format='PNG', pnginfo=pnginfo, **PNG_SAVE_OPTIONS)
+
 
 def create_yfinance_chart(data, period: str, ylabel: str, value_format: str, label: str) -> str:
     """
@@ -22,66 +197,62 @@ def create_yfinance_chart(data, period: str, ylabel: str, value_format: str, lab
     """
     if data.empty:
         return f"{label} data not available"
+    filepath = f"{_CHART_PATH_PREFIX}{label.translate(_YFINANCE_NAME_TABLE)}_{period}_chart.png"
+    key = _content_key(data, period, ylabel, value_format, label)
+    if _is_rendered(filepath, key):
+        return f"Chart saved: {filepath}"
 
-    # Period display names
-    period_display = {
-        "5d": "5 Days", "1mo": "1 Month", "3mo": "3 Months", "6mo": "6 Months",
-        "1y": "1 Year", "2y": "2 Years", "5y": "5 Years", "10y": "10 Years"
-    }.get(period, period)
+    period_display = PERIOD_DISPLAY.get(period, period)
     
-    fig, ax = plt.subplots(figsize=(10, 4))
+    fig, ax = _get_figure()
     
     # Candlestick plot using integer positions (no gaps for weekends)
-    ohlc = data[['Open', 'High', 'Low', 'Close']]
+    o, h, l, c = data[['Open', 'High', 'Low', 'Close']].to_numpy(dtype=float).T
     
-    # Filter out invalid data (where High/Low/Open are all 0)
-    valid_mask = (ohlc['High'] != 0) & (ohlc['Low'] != 0) & (ohlc['Open'] != 0)
-    ohlc = ohlc[valid_mask]
-    data = data[valid_mask]
+    # Filter out invalid data (where High/Low/Open are all 0), on the arrays; rows only copied when needed
+    valid_mask = (h != 0) & (l != 0) & (o != 0)
+    if not valid_mask.all():
+        o, h, l, c = o[valid_mask], h[valid_mask], l[valid_mask], c[valid_mask]
+        data = data[valid_mask]
     
     dates = data.index
-    num_candles = len(ohlc)
-    positions = range(num_candles)
+    num_candles = len(c)
     width = 0.6
     
-    for i, (o, h, l, c) in enumerate(ohlc.values):
-        color_candle = '#2ca02c' if c >= o else '#d62728'
-        # Wick
-        ax.vlines(i, l, h, color=color_candle, linewidth=1, zorder=2)
-        # Body
-        lower = min(o, c)
-        height = abs(c - o)
-        if height == 0:
-            ax.hlines(o, i - width/2, i + width/2, color=color_candle, linewidth=2, zorder=3)
-        else:
-            ax.add_patch(Rectangle((i - width/2, lower), width, height, 
-                                   facecolor=color_candle, edgecolor=color_candle, alpha=0.8, zorder=3))
+    # Candles as two collections (wicks + bodies) instead of one artist per candle
+    from matplotlib.collections import LineCollection, PolyCollection
+    x = np.arange(num_candles)
+    candle_colors = np.where(c >= o, '#2ca02c', '#d62728')
+    # Wick
+    wicks = np.stack([np.column_stack([x, l]), np.column_stack([x, h])], axis=1)
+    ax.add_collection(LineCollection(wicks, colors=candle_colors, linewidths=1, zorder=2))
+    # Body (flat candles get a ~1px minimum height so they still show as a line)
+    min_height = (np.nanmax(h) - np.nanmin(l)) * 0.003 if num_candles else 0
+    mid = (o + c) / 2
+    half = np.maximum(np.abs(c - o), min_height) / 2
+    left, right = x - width/2, x + width/2
+    bodies = np.stack([
+        np.column_stack([left, mid - half]), np.column_stack([right, mid - half]),
+        np.column_stack([right, mid + half]), np.column_stack([left, mid + half])
+    ], axis=1)
+    ax.add_collection(PolyCollection(bodies, facecolors=candle_colors, edgecolors=candle_colors, alpha=0.8, zorder=3))
+    ax.autoscale_view()
     
     # Overlay SMAs
-    try:
-        sma_plotted = False
-        period_lower = period.lower()
-        show_5_50 = period_lower in ["1mo", "3mo", "6mo"]
-        show_200 = period_lower in ["1y", "2y", "5y", "10y", "max"]
-        
-        if show_5_50 or show_200:
-            if 'SMA_5' in data.columns and (show_5_50 or show_200):
-                ax.plot(positions, data['SMA_5'], label='SMA 5', linewidth=1.2, color='#e377c2', 
-                        alpha=0.9, linestyle='-', zorder=4)
-                sma_plotted = True
-            if 'SMA_50' in data.columns and (show_5_50 or show_200):
-                ax.plot(positions, data['SMA_50'], label='SMA 50', linewidth=1.2, color='#8c564b', 
-                        alpha=0.9, linestyle='-', zorder=4)
-                sma_plotted = True
-            if 'SMA_200' in data.columns and show_200:
-                ax.plot(positions, data['SMA_200'], label='SMA 200', linewidth=2.0, color='#17becf', 
-                        alpha=1.0, linestyle='-', zorder=5)
-                sma_plotted = True
-        
-        if sma_plotted:
-            ax.legend(loc='upper left', fontsize=9)
-    except Exception:
-        pass
+    period_lower = period.lower()
+    show_5_50 = period_lower in ["1mo", "3mo", "6mo"]
+    show_200 = period_lower in ["1y", "2y", "5y", "10y", "max"]
+    overlays = (SMA_OVERLAYS[:2] if show_5_50 or show_200 else ()) + (SMA_OVERLAYS[2:] if show_200 else ())
+    columns = set(data.columns)
+    sma_plotted = False
+    for column, sma_label, linewidth, color, alpha, zorder in overlays:
+        if column in columns:
+            ax.plot(x, data[column].to_numpy(), label=sma_label, linewidth=linewidth, color=color,
+                    alpha=alpha, linestyle='-', zorder=zorder)
+            sma_plotted = True
+    
+    if sma_plotted:
+        ax.legend(loc='upper left')
     
     # X-axis: dates at integer positions
     ax.set_xlim(-0.5, num_candles - 0.5)
@@ -89,38 +260,31 @@ def create_yfinance_chart(data, period: str, ylabel: str, value_format: str, lab
     tick_positions = list(range(0, num_candles, tick_spacing))
     if tick_positions[-1] != num_candles - 1:
         tick_positions.append(num_candles - 1)
-    tick_labels = [dates[i].strftime('%Y-%m-%d') for i in tick_positions]
+    tick_labels = _date_labels(dates[tick_positions])
     ax.set_xticks(tick_positions)
     ax.set_xticklabels(tick_labels, rotation=45, ha='right')
     
     # Title and labels
-    ax.set_title(f'{label} - {period_display}', fontsize=13, fontweight='bold')
-    ax.set_ylabel(ylabel, fontsize=11)
+    ax.set_title(f'{label} - {period_display}')
+    ax.set_ylabel(ylabel)
     ax.grid(True, alpha=0.3, linestyle='--')
     
     # Value display
-    close_values = data['Close'].values
-    start_val = close_values[0]
-    end_val = close_values[-1]
+    start_val = c[0]
+    end_val = c[-1]
     change = ((end_val - start_val) / start_val) * 100 if start_val != 0 else 0
     change_color = 'green' if change < 0 else 'red'
+    fmt = _VALUE_FORMATTERS.get(value_format) or value_format.format
     
-    ax.text(0.02, 0.95, f'Start: {value_format.format(start_val)}', transform=ax.transAxes, 
-            verticalalignment='top', fontsize=10, bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
-    ax.text(0.02, 0.85, f'End: {value_format.format(end_val)}', transform=ax.transAxes, 
-            verticalalignment='top', fontsize=10, bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
-    ax.text(0.02, 0.75, f'Change: {change:+.2f}%', transform=ax.transAxes, 
-            verticalalignment='top', fontsize=10, fontweight='bold',
+    # Start/End share one box (one text layout and bbox patch); Change keeps its own up/down colored box
+    ax.text(0.02, 0.95, f'Start: {fmt(start_val)}\nEnd: {fmt(end_val)}', transform=ax.transAxes, 
+            verticalalignment='top', bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
+    ax.text(0.02, 0.77, f'Change: {change:+.2f}%', transform=ax.transAxes, 
+            verticalalignment='top', fontweight='bold',
             bbox=dict(boxstyle='round', facecolor=change_color, alpha=0.3))
     
-    plt.tight_layout()
-    
     # Save chart
-    name_clean = label.replace('^', '').replace('-', '_').replace(' ', '_').replace('%', 'pct')
-    filename = f"{name_clean}_{period}_chart.png"
-    filepath = os.path.join(CHART_OUTPUT_DIR, filename)
-    plt.savefig(filepath, dpi=100, bbox_inches='tight')
-    plt.close()
+    _save_figure(fig, filepath, key)
     
     return f"Chart saved: {filepath}"
 
@@ -131,7 +295,8 @@ def create_fred_chart(
     period: str = "6mo",
     baseline: float = None,
     positive_label: str = "Above Baseline",
-    negative_label: str = "Below Baseline"
+    negative_label: str = "Below Baseline",
+    shade: bool = None
 ) -> str:
     """
     Create line chart for FRED economic data with baseline.
@@ -143,52 +308,71 @@ def create_fred_chart(
         baseline: Optional baseline value (e.g., 0 for NFCI)
         positive_label: Label for values above baseline
         negative_label: Label for values below baseline
+        shade: Fill the area under the line; None means only when no baseline is drawn
+               (the baseline regions are shaded already)
         
     Returns:
         String with chart file path
     """
     if data.empty:
         return f"{label} data not available"
+    filepath = f"{_CHART_PATH_PREFIX}{label.translate(_FRED_NAME_TABLE)}_{period}_chart.png"
+    key = _content_key(data, label, period, baseline, positive_label, negative_label, shade)
+    if _is_rendered(filepath, key):
+        return f"Chart saved: {filepath}"
     
-    values = data.values
+    values = np.asarray(data, dtype=np.float64)  # one float ndarray for plotting, masks and the latest value
     dates = data.index
     
-    # Period display names
-    period_display = {
-        "5d": "5 Days", "1mo": "1 Month", "3mo": "3 Months", "6mo": "6 Months",
-        "1y": "1 Year", "2y": "2 Years", "5y": "5 Years", "10y": "10 Years"
-    }.get(period, period)
+    period_display = PERIOD_DISPLAY.get(period, period)
     
-    # Color scheme
-    colors = {"5d": "#1f77b4", "1mo": "#ff7f0e", "6mo": "#2ca02c", "1y": "#d62728", "2y": "#9467bd"}
-    color = colors.get(period, "#1f77b4")
+    color = PERIOD_COLORS.get(period, "#1f77b4")
     
-    fig, ax = plt.subplots(figsize=(10, 4))
+    fig, ax = _get_figure()
     
     # Line plot
-    ax.plot(dates, values, linewidth=2, color=color, marker='o', markersize=3, zorder=2)
-    ax.fill_between(dates, values, alpha=0.15, color=color, zorder=1)
+    # Downsample long series for drawing (latest/start values below still use the full data)
+    plot_dates, plot_values = dates, values
+    if len(values) > 2 * DOWNSAMPLE_TARGET_POINTS:
+        keep = _lttb(values, DOWNSAMPLE_TARGET_POINTS)
+        plot_dates, plot_values = dates[keep], values[keep]
+    
+    import matplotlib.dates as mdates
+    from matplotlib.artist import setp
+    
+    # Dates to Matplotlib float days once (vectorized), instead of unit conversion inside every plot call
+    x = mdates.date2num(plot_dates)
+    ax.xaxis_date()
+    
+    marker = 'o' if len(plot_values) <= MARKER_MAX_POINTS else None
+    ax.plot(x, plot_values, linewidth=2, color=color, marker=marker, markersize=3, zorder=2)
+    if shade is None:
+        shade = baseline is None
+    if shade:
+        ax.fill_between(x, plot_values, alpha=0.15, color=color, zorder=1)
     
     # Add baseline if provided
     if baseline is not None:
         ax.axhline(y=baseline, color='black', linestyle='--', linewidth=1, alpha=0.5, 
                    label=f'Baseline ({baseline})')
         
-        # Shade positive/negative regions
-        ax.fill_between(dates, baseline, values, 
-                         where=(values >= baseline), color='red', alpha=0.1, label=positive_label)
-        ax.fill_between(dates, baseline, values, 
-                         where=(values < baseline), color='green', alpha=0.1, label=negative_label)
-        ax.legend(loc='upper left', fontsize=9)
+        # Shade positive/negative regions (one mask; a side with no points gets no polygon)
+        above = plot_values >= baseline
+        if above.any():
+            ax.fill_between(x, baseline, plot_values, 
+                             where=above, color='red', alpha=0.1, label=positive_label)
+        if not above.all():
+            ax.fill_between(x, baseline, plot_values, 
+                             where=~above, color='green', alpha=0.1, label=negative_label)
+        ax.legend(loc='upper left')
     
     # Title and labels
-    ax.set_title(f'{label} - {period_display}', fontsize=13, fontweight='bold')
-    ax.set_ylabel(f'{label} Value', fontsize=11)
+    ax.set_title(f'{label} - {period_display}')
+    ax.set_ylabel(f'{label} Value')
     ax.grid(True, alpha=0.3, linestyle='--')
     
     # Value display
-    start_val = values[0]
-    end_val = values[-1]
+    end_val = float(values[-1])
     
     if baseline is not None:
         # FRED style: latest value with condition
@@ -197,7 +381,7 @@ def create_fred_chart(
         box_color = '#ffcccc' if end_val >= baseline else '#ccffcc'
         
         ax.text(0.02, 0.95, f'Latest ({latest_date}): {end_val:.3f}', 
-                transform=ax.transAxes, verticalalignment='top', fontsize=10, fontweight='bold',
+                transform=ax.transAxes, verticalalignment='top', fontweight='bold',
                 bbox=dict(boxstyle='round', facecolor=box_color, alpha=0.7))
         
         if condition:
@@ -210,16 +394,10 @@ def create_fred_chart(
         ax.xaxis.set_major_formatter(mdates.DateFormatter('%m/%d'))
     else:
         ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-    plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, ha='right')
-    
-    plt.tight_layout()
+    setp(ax.xaxis.get_majorticklabels(), rotation=45, ha='right')
     
     # Save chart
-    label_clean = label.replace(' ', '_').replace('(', '').replace(')', '').replace('%', 'pct')
-    filename = f"{label_clean}_{period}_chart.png"
-    filepath = os.path.join(CHART_OUTPUT_DIR, filename)
-    plt.savefig(filepath, dpi=100, bbox_inches='tight')
-    plt.close()
+    _save_figure(fig, filepath, key)
     
     return f"Chart saved: {filepath}"
 
@@ -257,61 +435,68 @@ def create_line_chart(
     """
     if data.empty:
         return f"{label} data not available"
+    filepath = f"{_CHART_PATH_PREFIX}{label.translate(_LINE_NAME_TABLE)}_{period}_chart.png"
+    key = _content_key(data, label, ylabel, period, value_format, overbought_label, oversold_label,
+                       data_column, threshold_upper, threshold_lower)
+    if _is_rendered(filepath, key):
+        return f"Chart saved: {filepath}"
+    
+    # Handle different data types; plain float ndarray from here on (no pandas indexing on the plotting path)
+    values = np.ascontiguousarray(data[data_column] if hasattr(data, 'columns') and data_column else data,
+                                  dtype=np.float64)
+    dates = data.index
     
-    # Handle different data types
-    if hasattr(data, 'columns') and data_column:
-        values = data[data_column]
-        dates = data.index
-    else:
-        values = data.values if hasattr(data, 'values') else data
-        dates = data.index
-    
-    # Remove NaN values
-    if isinstance(values, pd.Series):
-        valid_mask = values.notna()
+    # Remove NaN values (arrays are only copied when something is missing)
+    valid_mask = ~np.isnan(values)
+    if not valid_mask.all():
         values = values[valid_mask]
         dates = dates[valid_mask]
     
-    # Period display names
-    period_display = {
-        "5d": "5 Days", "1mo": "1 Month", "3mo": "3 Months", "6mo": "6 Months",
-        "1y": "1 Year", "2y": "2 Years", "5y": "5 Years", "10y": "10 Years"
-    }.get(period, period)
+    period_display = PERIOD_DISPLAY.get(period, period)
     
-    colors = {"5d": "#1f77b4", "1mo": "#ff7f0e", "6mo": "#2ca02c", "1y": "#d62728", "2y": "#9467bd"}
-    color = colors.get(period, "#1f77b4")
+    color = PERIOD_COLORS.get(period, "#1f77b4")
     
-    fig, ax = plt.subplots(figsize=(10, 4))
+    fig, ax = _get_figure()
     
     # Use integer positions (no gaps for weekends/holidays)
     num_points = len(values)
-    positions = range(num_points)
+    positions = np.arange(num_points)
+    
+    # Downsample long series for drawing; kept points stay at their original positions
+    if num_points > 2 * DOWNSAMPLE_TARGET_POINTS:
+        keep = _lttb(values, DOWNSAMPLE_TARGET_POINTS)
+        positions, values = positions[keep], values[keep]
     
     # Line plot
-    ax.plot(positions, values, linewidth=2, color=color, marker='o', markersize=3, zorder=3, label='Value')
+    marker = 'o' if len(values) <= MARKER_MAX_POINTS else None
+    ax.plot(positions, values, linewidth=2, color=color, marker=marker, markersize=3, zorder=3, label='Value')
     
     # Add threshold lines if provided
     if threshold_upper is not None:
         ax.axhline(y=threshold_upper, color='red', linestyle='--', linewidth=1.5, alpha=0.7, 
                    label=f'Overbought ({threshold_upper:.1f})', zorder=2)
-        # Shade overbought zone
-        ax.fill_between(positions, threshold_upper, values, 
-                         where=(values >= threshold_upper), color='red', alpha=0.1, label=overbought_label)
+        # Shade overbought zone (skipped when no point reaches it)
+        overbought = values >= threshold_upper
+        if overbought.any():
+            ax.fill_between(positions, threshold_upper, values, 
+                             where=overbought, color='red', alpha=0.1, label=overbought_label)
     
     if threshold_lower is not None:
         ax.axhline(y=threshold_lower, color='green', linestyle='--', linewidth=1.5, alpha=0.7, 
                    label=f'Oversold ({threshold_lower:.1f})', zorder=2)
-        # Shade oversold zone
-        ax.fill_between(positions, values, threshold_lower, 
-                         where=(values <= threshold_lower), color='green', alpha=0.1, label=oversold_label)
+        # Shade oversold zone (skipped when no point reaches it)
+        oversold = values <= threshold_lower
+        if oversold.any():
+            ax.fill_between(positions, values, threshold_lower, 
+                             where=oversold, color='green', alpha=0.1, label=oversold_label)
     
     # Show legend if any thresholds were added
     if threshold_upper is not None or threshold_lower is not None:
-        ax.legend(loc='upper left', fontsize=9)
+        ax.legend(loc='upper left')
     
     # Title and labels
-    ax.set_title(f'{label} - {period_display}', fontsize=13, fontweight='bold')
-    ax.set_ylabel(ylabel, fontsize=11)
+    ax.set_title(f'{label} - {period_display}')
+    ax.set_ylabel(ylabel)
     ax.grid(True, alpha=0.3, linestyle='--')
     
     # X-axis: dates at integer positions
@@ -320,17 +505,11 @@ def create_line_chart(
     tick_positions = list(range(0, num_points, tick_spacing))
     if tick_positions[-1] != num_points - 1:
         tick_positions.append(num_points - 1)
-    tick_labels = [dates[i].strftime('%Y-%m-%d') for i in tick_positions]
+    tick_labels = _date_labels(dates[tick_positions])
     ax.set_xticks(tick_positions)
     ax.set_xticklabels(tick_labels, rotation=45, ha='right')
     
-    plt.tight_layout()
-    
     # Save chart
-    label_clean = label.replace('^', '').replace('-', '_').replace(' ', '_').replace('(', '').replace(')', '').replace('/', '_').replace('%', 'pct')
-    filename = f"{label_clean}_{period}_chart.png"
-    filepath = os.path.join(CHART_OUTPUT_DIR, filename)
-    plt.savefig(filepath, dpi=100, bbox_inches='tight')
-    plt.close()
+    _save_figure(fig, filepath, key)
     
     return f"Chart saved: {filepath}"
@@ -3,19 +3,25 @@
 import unittest
 import asyncio
 import os
+import tempfile
+from functools import lru_cache
+import numpy as np
 import pandas as pd
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, create_autospec
 from src.data_sources import get_data_source
+from src.data_sources.base import DataSource
+from src.utils import charts
 from src.utils.charts import create_yfinance_chart, create_fred_chart
 
 
-class TestYFinanceCharts(unittest.TestCase):
-    """Test yfinance chart generation"""
-    
-    def setUp(self):
-        """Set up test fixtures"""
-        # Create mock data for different periods
-        self.mock_data_5d = {
+@lru_cache(maxsize=1)
+def _make_mock_frames() -> dict[str, dict]:
+    """Mock yfinance data for different periods, shared by the test classes (tests don't mutate it)"""
+    # Rising series as one arange plus per-column offsets
+    base_1mo = np.arange(20, dtype=np.int64)
+    base_1y = np.arange(250, dtype=np.int64)
+    return {
+        '5d': {
             'data': pd.DataFrame({
                 'Open': [100, 101, 102, 103, 104],
                 'High': [105, 106, 107, 108, 109],
@@ -24,38 +30,66 @@ class TestYFinanceCharts(unittest.TestCase):
                 'SMA_5': [102, 103, 104, 105, 106],
                 'SMA_20': [101, 102, 103, 104, 105]
             }, index=pd.bdate_range('2024-01-01', periods=5))  # Business days only
-        }
-        
-        self.mock_data_1mo = {
+        },
+        '1mo': {
             'data': pd.DataFrame({
-                'Open': [100 + i for i in range(20)],
-                'High': [105 + i for i in range(20)],
-                'Low': [99 + i for i in range(20)],
-                'Close': [104 + i for i in range(20)],
-                'SMA_5': [102 + i for i in range(20)],
-                'SMA_20': [101 + i for i in range(20)]
+                'Open': base_1mo + 100,
+                'High': base_1mo + 105,
+                'Low': base_1mo + 99,
+                'Close': base_1mo + 104,
+                'SMA_5': base_1mo + 102,
+                'SMA_20': base_1mo + 101
             }, index=pd.bdate_range('2024-01-01', periods=20))  # Business days only
-        }
-        
-        self.mock_data_1y = {
+        },
+        '1y': {
             'data': pd.DataFrame({
-                'Open': [100 + i for i in range(250)],
-                'High': [105 + i for i in range(250)],
-                'Low': [99 + i for i in range(250)],
-                'Close': [104 + i for i in range(250)],
-                'SMA_5': [102 + i for i in range(250)],
-                'SMA_20': [101 + i for i in range(250)],
-                'SMA_200': [100 + i for i in range(250)]
+                'Open': base_1y + 100,
+                'High': base_1y + 105,
+                'Low': base_1y + 99,
+                'Close': base_1y + 104,
+                'SMA_5': base_1y + 102,
+                'SMA_20': base_1y + 101,
+                'SMA_200': base_1y + 100
             }, index=pd.bdate_range('2024-01-01', periods=250))  # Business days only
-        }
+        },
+    }
+
+
+def _use_temp_chart_dir(test: unittest.TestCase) -> str:
+    """Point chart output at a per-test temp dir (removed on cleanup) so tests never write into ./charts."""
+    chart_dir = tempfile.TemporaryDirectory()
+    test.addCleanup(chart_dir.cleanup)
+    for name, value in (('CHART_OUTPUT_DIR', chart_dir.name), ('_CHART_PATH_PREFIX', os.path.join(chart_dir.name, ''))):
+        patcher = patch.object(charts, name, value)
+        patcher.start()
+        test.addCleanup(patcher.stop)
+    return chart_dir.name
+
+
+def _mock_source(data):
+    """DataSource mock (spec'd, so misspelled methods fail) whose fetch_data returns data."""
+    mock_source = create_autospec(DataSource, instance=True)
+    mock_source.fetch_data.return_value = data
+    return mock_source
+
+
+class TestYFinanceCharts(unittest.TestCase):
+    """Test yfinance chart generation"""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures (shared, built once)"""
+        frames = _make_mock_frames()
+        cls.mock_data_5d, cls.mock_data_1mo, cls.mock_data_1y = frames['5d'], frames['1mo'], frames['1y']
+    
+    def setUp(self):
+        """Write charts into a temp dir"""
+        _use_temp_chart_dir(self)
     
     @patch('src.data_sources.get_data_source')
     def test_chart_5d_no_sma(self, mock_get_source):
         """Test 5-day chart without SMAs"""
-        # Mock the data source
-        mock_source = MagicMock()
-        mock_source.fetch_data.return_value = self.mock_data_5d
-        mock_get_source.return_value = mock_source
+        mock_get_source.return_value = _mock_source(self.mock_data_5d)
         
         result = create_yfinance_chart(
             label="AAPL",
@@ -72,10 +106,7 @@ class TestYFinanceCharts(unittest.TestCase):
     @patch('src.data_sources.get_data_source')
     def test_chart_1mo_with_sma(self, mock_get_source):
         """Test 1-month chart with SMA 5, 20"""
-        # Mock the data source
-        mock_source = MagicMock()
-        mock_source.fetch_data.return_value = self.mock_data_1mo
-        mock_get_source.return_value = mock_source
+        mock_get_source.return_value = _mock_source(self.mock_data_1mo)
         
         result = create_yfinance_chart(
             label="AAPL",
@@ -94,10 +125,7 @@ class TestYFinanceCharts(unittest.TestCase):
     @patch('src.data_sources.get_data_source')
     def test_chart_1y_with_sma_200(self, mock_get_source):
         """Test 1-year chart with SMA 5, 20, 200"""
-        # Mock the data source
-        mock_source = MagicMock()
-        mock_source.fetch_data.return_value = self.mock_data_1y
-        mock_get_source.return_value = mock_source
+        mock_get_source.return_value = _mock_source(self.mock_data_1y)
         
         result = create_yfinance_chart(
             label="AAPL",
@@ -129,10 +157,7 @@ class TestYFinanceCharts(unittest.TestCase):
             }, index=pd.bdate_range('2024-01-01', periods=120))  # Business days only
         }
         
-        # Mock the data source
-        mock_source = MagicMock()
-        mock_source.fetch_data.return_value = mock_treasury_data
-        mock_get_source.return_value = mock_source
+        mock_get_source.return_value = _mock_source(mock_treasury_data)
         
         result = create_yfinance_chart(
             label="^TNX",
@@ -156,10 +181,8 @@ class TestYFinanceCharts(unittest.TestCase):
         self.assertIn('Close', hist.columns)
         
         # Verify only trading days (no weekends)
-        dates = hist.index
-        for date in dates:
-            # Trading days are Mon-Fri (0-4), Saturday=5, Sunday=6
-            self.assertIn(date.weekday(), range(5))
+        # Trading days are Mon-Fri (0-4), Saturday=5, Sunday=6
+        self.assertTrue((hist.index.weekday < 5).all())
 
 
 class TestFREDCharts(unittest.TestCase):
@@ -167,6 +190,8 @@ class TestFREDCharts(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures"""
+        self.chart_dir = _use_temp_chart_dir(self)
+        
         # Create mock FRED data
         self.mock_fred_data = {
             'data': pd.Series(
@@ -178,10 +203,7 @@ class TestFREDCharts(unittest.TestCase):
     @patch('src.data_sources.get_data_source')
     def test_chart_nfci(self, mock_get_source):
         """Test NFCI chart with baseline"""
-        # Mock the data source
-        mock_source = MagicMock()
-        mock_source.fetch_data.return_value = self.mock_fred_data
-        mock_get_source.return_value = mock_source
+        mock_get_source.return_value = _mock_source(self.mock_fred_data)
         
         result = create_fred_chart(
             data=self.mock_fred_data['data'],
@@ -193,47 +215,43 @@ class TestFREDCharts(unittest.TestCase):
         )
         
         self.assertIn("Chart saved:", result)
+        self.assertTrue(result.endswith(os.path.join(self.chart_dir, "National_Financial_Conditions_Index_6mo_chart.png")))
+    
+    def test_chart_unchanged_data_not_rerendered(self):
+        """Test that an identical chart request reuses the saved file, and a changed file is rendered again"""
+        data = self.mock_fred_data['data']
+        
+        with patch('src.utils.charts._save_figure', wraps=charts._save_figure) as mock_save:
+            first = create_fred_chart(data=data, label="Cached NFCI", period="6mo", baseline=0)
+            second = create_fred_chart(data=data, label="Cached NFCI", period="6mo", baseline=0)
+            # Same path overwritten with other content, then the original is requested again
+            third = create_fred_chart(data=data * 2, label="Cached NFCI", period="6mo", baseline=0)
+            fourth = create_fred_chart(data=data, label="Cached NFCI", period="6mo", baseline=0)
+        
+        self.assertEqual(first, second)
+        self.assertEqual(first, third)
+        self.assertEqual(first, fourth)
+        self.assertEqual(mock_save.call_count, 3)
+    
+    def test_chart_content_key(self):
+        """Test the content key changes with column names and CHART_RENDER_VERSION"""
+        frame = self.mock_fred_data['data'].to_frame(name='A')
+        key = charts._content_key(frame, 'label')
+        
+        self.assertEqual(key, charts._content_key(frame.copy(), 'label'))
+        self.assertNotEqual(key, charts._content_key(frame.rename(columns={'A': 'B'}), 'label'))
+        with patch.object(charts, 'CHART_RENDER_VERSION', charts.CHART_RENDER_VERSION + 1):
+            self.assertNotEqual(key, charts._content_key(frame, 'label'))
 
 
 class TestChartFeatures(unittest.TestCase):
     """Test specific chart features"""
     
-    def setUp(self):
-        """Set up test fixtures"""
-        # Create mock data for different periods
-        self.mock_data_5d = {
-            'data': pd.DataFrame({
-                'Open': [100, 101, 102, 103, 104],
-                'High': [105, 106, 107, 108, 109],
-                'Low': [99, 100, 101, 102, 103],
-                'Close': [104, 105, 106, 107, 108],
-                'SMA_5': [102, 103, 104, 105, 106],
-                'SMA_20': [101, 102, 103, 104, 105]
-            }, index=pd.bdate_range('2024-01-01', periods=5))  # Business days only
-        }
-        
-        self.mock_data_1mo = {
-            'data': pd.DataFrame({
-                'Open': [100 + i for i in range(20)],
-                'High': [105 + i for i in range(20)],
-                'Low': [99 + i for i in range(20)],
-                'Close': [104 + i for i in range(20)],
-                'SMA_5': [102 + i for i in range(20)],
-                'SMA_20': [101 + i for i in range(20)]
-            }, index=pd.bdate_range('2024-01-01', periods=20))  # Business days only
-        }
-        
-        self.mock_data_1y = {
-            'data': pd.DataFrame({
-                'Open': [100 + i for i in range(250)],
-                'High': [105 + i for i in range(250)],
-                'Low': [99 + i for i in range(250)],
-                'Close': [104 + i for i in range(250)],
-                'SMA_5': [102 + i for i in range(250)],
-                'SMA_20': [101 + i for i in range(250)],
-                'SMA_200': [100 + i for i in range(250)]
-            }, index=pd.bdate_range('2024-01-01', periods=250))  # Business days only
-        }
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures (shared, built once)"""
+        frames = _make_mock_frames()
+        cls.mock_data_5d, cls.mock_data_1mo, cls.mock_data_1y = frames['5d'], frames['1mo'], frames['1y']
     
     def test_sma_by_period(self):
         """Test SMA presence varies by period"""
@@ -252,6 +270,28 @@ class TestChartFeatures(unittest.TestCase):
         self.assertIn('SMA_5', hist_1y.columns)
         self.assertIn('SMA_20', hist_1y.columns)
         self.assertIn('SMA_200', hist_1y.columns)
+    
+    def test_lttb_downsampling(self):
+        """Test LTTB keeps the endpoints and the extremes of a long series"""
+        values = np.sin(np.arange(5000) / 50)
+        keep = charts._lttb(values, 1000)
+        
+        self.assertEqual(len(keep), 1000)
+        self.assertEqual((keep[0], keep[-1]), (0, 4999))
+        self.assertTrue((np.diff(keep) > 0).all())
+        self.assertAlmostEqual(values[keep].max(), values.max(), places=3)
+    
+    def test_lttb_skips_nan(self):
+        """Test LTTB never picks NaN points (e.g. FRED holidays)"""
+        values = np.sin(np.arange(5000) / 50)
+        values[::7] = np.nan
+        values[-1] = np.nan
+        keep = charts._lttb(values, 1000)
+        
+        self.assertEqual(len(keep), 1000)
+        self.assertFalse(np.isnan(values[keep]).any())
+        self.assertEqual((keep[0], keep[-1]), (1, 4997))  # first/last finite points
+        self.assertTrue((np.diff(keep) > 0).all())
 
 
 if __name__ == "__main__":
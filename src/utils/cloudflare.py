@@ -2,19 +2,27 @@
 
 import io
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from dotenv import load_dotenv
+from types import MappingProxyType
 
+import httpx
 import pandas as pd
 
+from src.config import load_env
+
 try:
     import boto3  # type: ignore[import-untyped]
+    from boto3.s3.transfer import TransferConfig  # type: ignore[import-untyped]
     from botocore.config import Config  # type: ignore[import-untyped]
 except ImportError:
     boto3 = None  # type: ignore[assignment]
+    TransferConfig = None  # type: ignore[assignment]
     Config = None  # type: ignore[assignment]
 
-load_dotenv()
+# R2 settings below are module constants (also imported elsewhere), so they need .env at import
+load_env()
 
 # R2 credentials
 R2_BUCKET_NAME = os.getenv('R2_BUCKET_NAME', '')  # Public (CSV)
@@ -25,9 +33,36 @@ R2_SECRET_ACCESS_KEY = os.getenv('R2_SECRET_ACCESS_KEY', '')
 # Public URL for CSV files (no auth needed)
 R2_PUBLIC_URL = os.getenv('R2_PUBLIC_URL', '')
 
+# Content-Type by file extension for public uploads
+_CONTENT_TYPES = MappingProxyType({
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.csv': 'text/csv',
+})
+
+# R2 client settings: pool sized for LIST_CONCURRENCY listings plus multipart upload threads
+_S3_CONFIG = Config(
+    signature_version='s3v4',
+    max_pool_connections=32,
+    retries={'max_attempts': 3, 'mode': 'standard'},
+    tcp_keepalive=True
+) if Config else None
+
+# Large CSVs (>8MB) go up as parallel multipart chunks; typical score files are a single PUT
+CSV_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    max_concurrency=4,
+    use_threads=True
+) if TransferConfig else None
+
+# Sub-folders listed in parallel by list_cloud_files (within the client's 32-connection pool)
+LIST_CONCURRENCY = 8
 
+
+@lru_cache(maxsize=1)
 def _get_s3_client():
-    """Get S3 client for R2."""
+    """Get S3 client for R2 (built once per process so calls reuse its keep-alive connection pool)."""
     if not boto3 or not Config:
         print(f"boto3 or Config not available: boto3={boto3}, Config={Config}")
         return None
@@ -38,7 +73,7 @@ def _get_s3_client():
             endpoint_url=f'https://{R2_ACCOUNT_ID}.r2.cloudflarestorage.com',
             aws_access_key_id=R2_ACCESS_KEY_ID,
             aws_secret_access_key=R2_SECRET_ACCESS_KEY,
-            config=Config(signature_version='s3v4')
+            config=_S3_CONFIG
         )
     except Exception as e:
         print(f"Error creating S3 client: {e}")
@@ -94,40 +129,96 @@ def download_from_cloud(cloud_path: str, local_path: Path) -> bool:
         return False
 
 
-def read_csv_from_cloud(cloud_path: str) -> pd.DataFrame | None:
-    """Read CSV from public URL (no auth needed)."""
-    import urllib.request
+@lru_cache(maxsize=1)
+def _get_public_client() -> httpx.Client:
+    """HTTP client for the public bucket URL (built once per process so reads reuse keep-alive connections)."""
+    return httpx.Client(
+        headers={'User-Agent': 'Mozilla/5.0'},
+        timeout=10.0,
+        follow_redirects=True,
+        limits=httpx.Limits(max_keepalive_connections=16, max_connections=32)
+    )
+
+
+class _ResponseStream(io.RawIOBase):
+    """Read-only file object over a streaming httpx response's decoded body chunks."""
+    
+    def __init__(self, response: httpx.Response):
+        self._chunks = response.iter_bytes()
+        self._pending = b''
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            self._pending = next(self._chunks, None)
+            if self._pending is None:
+                self._pending = b''
+                return 0  # EOF
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def read_csv_from_cloud(cloud_path: str, columns: list[str] | None = None) -> pd.DataFrame | None:
+    """Read CSV from public URL (no auth needed).
     
+    Args:
+        cloud_path: Cloud storage path
+        columns: Only parse these columns (None parses all; None is also returned if one is missing)
+    """
     try:
-        url = f"{R2_PUBLIC_URL}/{cloud_path}"
-        req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-        with urllib.request.urlopen(req, timeout=10) as response:
-            return pd.read_csv(io.BytesIO(response.read()))
+        with _get_public_client().stream('GET', f"{R2_PUBLIC_URL}/{cloud_path}") as response:
+            response.raise_for_status()
+            # Parse straight from the response stream (no full-body bytes copy)
+            return pd.read_csv(io.BufferedReader(_ResponseStream(response)), usecols=columns)
     except Exception:
         return None
 
 
-def write_csv_to_cloud(df: pd.DataFrame, cloud_path: str) -> bool:
-    """Write CSV to public bucket (requires auth)."""
-    if not boto3 or not Config:
+def head_public(cloud_path: str) -> bool:
+    """Check if a file exists at the public URL with a HEAD request (no body download, no auth needed)."""
+    try:
+        return _get_public_client().head(f"{R2_PUBLIC_URL}/{cloud_path}").status_code == 200
+    except Exception:
+        return False
+
+
+def public_etag(cloud_path: str) -> str | None:
+    """ETag of the file at the public URL (HEAD request), None if missing or unreachable."""
+    try:
+        response = _get_public_client().head(f"{R2_PUBLIC_URL}/{cloud_path}")
+        return response.headers.get('ETag') if response.status_code == 200 else None
+    except Exception:
+        return None
+
+
+def write_csv_to_cloud(df: pd.DataFrame, cloud_path: str, index: bool = False, index_label: str | None = None) -> bool:
+    """Write CSV to public bucket (requires auth).
+    
+    Args:
+        df: DataFrame to write
+        cloud_path: Cloud storage path
+        index: Write the index as the first column (avoids a reset_index copy)
+        index_label: Column name for the index when index=True
+    """
+    s3_client = _get_s3_client()
+    if not s3_client:
         return False
     
     try:
-        s3_client = boto3.client(
-            's3',
-            endpoint_url=f'https://{R2_ACCOUNT_ID}.r2.cloudflarestorage.com',
-            aws_access_key_id=R2_ACCESS_KEY_ID,
-            aws_secret_access_key=R2_SECRET_ACCESS_KEY,
-            config=Config(signature_version='s3v4')
-        )
-        
-        csv_buffer = io.StringIO()
-        df.to_csv(csv_buffer, index=False)
-        s3_client.put_object(
-            Bucket=R2_BUCKET_NAME,
-            Key=cloud_path,
-            Body=csv_buffer.getvalue().encode('utf-8'),
-            ContentType='text/csv'
+        # Encode straight into a bytes buffer (no str -> encode() copy)
+        csv_buffer = io.BytesIO()
+        df.to_csv(csv_buffer, index=index, index_label=index_label, encoding='utf-8')
+        csv_buffer.seek(0)
+        s3_client.upload_fileobj(
+            csv_buffer,
+            R2_BUCKET_NAME,
+            cloud_path,
+            ExtraArgs={'ContentType': 'text/csv'},
+            Config=CSV_TRANSFER_CONFIG
         )
         return True
     except Exception:
@@ -164,29 +255,16 @@ def upload_file_to_public_cloud(file_path: Path, cloud_path: str) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    if not boto3 or not Config:
+    s3_client = _get_s3_client()
+    if not s3_client:
         return False
     
     if not file_path.exists():
         return False
     
     try:
-        s3_client = boto3.client(
-            's3',
-            endpoint_url=f'https://{R2_ACCOUNT_ID}.r2.cloudflarestorage.com',
-            aws_access_key_id=R2_ACCESS_KEY_ID,
-            aws_secret_access_key=R2_SECRET_ACCESS_KEY,
-            config=Config(signature_version='s3v4')
-        )
-        
         # Determine content type based on file extension
-        content_type = 'application/octet-stream'
-        if file_path.suffix.lower() == '.png':
-            content_type = 'image/png'
-        elif file_path.suffix.lower() == '.jpg' or file_path.suffix.lower() == '.jpeg':
-            content_type = 'image/jpeg'
-        elif file_path.suffix.lower() == '.csv':
-            content_type = 'text/csv'
+        content_type = _CONTENT_TYPES.get(file_path.suffix.lower(), 'application/octet-stream')
         
         s3_client.upload_file(
             str(file_path),
@@ -214,12 +292,25 @@ def list_cloud_files(prefix: str = '') -> list[str]:
         return []
     
     try:
-        files = []
         paginator = s3_client.get_paginator('list_objects_v2')
-        for page in paginator.paginate(Bucket=R2_BUCKET_NAME, Prefix=prefix):
-            if 'Contents' in page:
-                for obj in page['Contents']:
-                    files.append(obj['Key'])
+        
+        # One delimited listing finds the keys directly under prefix and its sub-folders
+        files, sub_prefixes = [], []
+        for page in paginator.paginate(Bucket=R2_BUCKET_NAME, Prefix=prefix, Delimiter='/'):
+            files.extend(obj['Key'] for obj in page.get('Contents', []))
+            sub_prefixes.extend(p['Prefix'] for p in page.get('CommonPrefixes', []))
+        
+        # Sub-folders are listed concurrently (each is its own chain of page round-trips)
+        if sub_prefixes:
+            def _list_prefix(sub_prefix: str) -> list[str]:
+                return [obj['Key']
+                        for page in paginator.paginate(Bucket=R2_BUCKET_NAME, Prefix=sub_prefix)
+                        for obj in page.get('Contents', [])]
+            
+            with ThreadPoolExecutor(max_workers=min(LIST_CONCURRENCY, len(sub_prefixes))) as executor:
+                for keys in executor.map(_list_prefix, sub_prefixes):
+                    files.extend(keys)
+            files.sort()  # Same key order as a single flat listing
         return files
     except Exception as e:
         print(f"Error listing cloud files (bucket={R2_BUCKET_NAME}, prefix={prefix}): {e}")
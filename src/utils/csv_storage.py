@@ -5,7 +5,10 @@ from pathlib import Path
 
 import pandas as pd
 
-from .cloudflare import read_csv_from_cloud, write_csv_to_cloud
+from .cloudflare import head_public, public_etag, read_csv_from_cloud, write_csv_to_cloud
+
+# {cloud_key: (etag, last_date)} - last report date per CSV version
+_last_date_cache: dict[str, tuple[str, datetime | None]] = {}
 
 
 def read_csv(cloud_path: str | None, local_path: Path) -> pd.DataFrame | None:
@@ -32,8 +35,22 @@ def write_csv(df: pd.DataFrame, cloud_path: str | None, local_path: Path) -> boo
 
 
 def get_last_date_from_csv(cloud_path: str | None, local_path: Path) -> datetime | None:
-    """Get last report date from CSV."""
-    df = read_csv(cloud_path, local_path)
+    """Get last report date from CSV (re-read only when the file's ETag changed)."""
+    cloud_key = cloud_path or local_path.name
+    etag = public_etag(cloud_key)
+    cached = _last_date_cache.get(cloud_key)
+    if etag and cached and cached[0] == etag:
+        return cached[1]
+    
+    last_date = _read_last_date(cloud_key)
+    if etag:
+        _last_date_cache[cloud_key] = (etag, last_date)
+    return last_date
+
+
+def _read_last_date(cloud_key: str) -> datetime | None:
+    """Download the CSV's Report_Date column and return its max."""
+    df = read_csv_from_cloud(cloud_key, columns=['Report_Date'])  # only the date column is parsed
     if df is None or df.empty or 'Report_Date' not in df.columns:
         return None
     
@@ -46,7 +63,7 @@ def get_last_date_from_csv(cloud_path: str | None, local_path: Path) -> datetime
 
 
 def csv_exists(cloud_path: str | None, local_path: Path) -> bool:
-    """Check if CSV exists in public URL."""
+    """Check if CSV exists in public URL (HEAD request; the CSV is not downloaded)."""
     cloud_key = cloud_path or local_path.name
-    return read_csv_from_cloud(cloud_key) is not None
+    return head_public(cloud_key)
 
@@ -5,6 +5,7 @@ Provides functions for calculating various technical indicators including
 moving averages, disparity (이격도), RSI, and MACD.
 """
 
+import numpy as np
 import pandas as pd
 
 
@@ -23,6 +24,33 @@ def calculate_sma(data: pd.DataFrame, window: int, price_column: str = 'Close')
     return data[price_column].rolling(window=window).mean()
 
 
+def calculate_smas(data: pd.DataFrame, windows: list[int], price_column: str = 'Close') -> dict[int, pd.Series]:
+    """
+    Calculate several Simple Moving Averages (SMA) from one shared cumulative sum.
+    
+    Args:
+        data: DataFrame with price data
+        windows: Moving average windows (e.g., [5, 20, 50, 200])
+        price_column: Column name for price data (default: 'Close')
+        
+    Returns:
+        Dictionary mapping window to SMA Series (same values as calculate_sma)
+    """
+    prices = data[price_column].to_numpy(dtype=np.float64)
+    if np.isnan(prices).any():
+        # Keep rolling() semantics for gaps (a NaN anywhere in the window gives NaN)
+        return {window: calculate_sma(data, window, price_column) for window in windows}
+    
+    csum = np.concatenate(([0.0], np.cumsum(prices)))
+    smas = {}
+    for window in windows:
+        sma = np.full(len(prices), np.nan)
+        if window <= len(prices):
+            sma[window - 1:] = (csum[window:] - csum[:-window]) / window
+        smas[window] = pd.Series(sma, index=data.index, name=price_column)
+    return smas
+
+
 def calculate_ema(data: pd.DataFrame, window: int, price_column: str = 'Close') -> pd.Series:
     """
     Calculate Exponential Moving Average (EMA) for given data.